@@ -74,6 +74,9 @@ class MockCamera:
         self.settings = settings
         self.is_open = False
         self.test_images = self._load_test_images()
+        # Encoded streaming data URIs, keyed by test image index. The mock
+        # frames never change, so each image is JPEG-encoded at most once.
+        self._data_uri_cache: Dict[int, str] = {}
 
     def _load_test_images(self) -> List[np.ndarray]:
         """Load test images from the test directory.
@@ -176,10 +179,15 @@ class MockCamera:
         # No artificial delay needed: real Basler camera trigger time is ~1-5ms (negligible)
         # For batch captures, grab_frames() adds realistic delays (0.1s per frame)
 
-        # Cycle through available test images
-        # Use a simple counter based on time to simulate different frames
-        frame_idx = int(time.time() * 10) % len(self.test_images)
-        return self.test_images[frame_idx].copy()
+        return self.test_images[self._current_frame_index()].copy()
+
+    def _current_frame_index(self) -> int:
+        """Index of the test image to serve for the current frame.
+
+        Cycles through available test images using a simple counter based
+        on time to simulate different frames.
+        """
+        return int(time.time() * 10) % len(self.test_images)
 
     def grab_frames(self, num_frames: Optional[int] = None) -> List[np.ndarray]:
         """Grab multiple frames from the mock camera.
@@ -215,7 +223,9 @@ class MockCamera:
 
         This method is optimized for streaming use cases where frames need
         to be transmitted over IPC as base64 data URIs. JPEG quality=85
-        reduces payload from ~2.9 MB (PNG) to ~266 KB per frame.
+        reduces payload from ~2.9 MB (PNG) to ~266 KB per frame. Mock
+        frames are constant, so each test image's data URI is encoded once
+        and served from a cache on later frames.
 
         Returns:
             Base64-encoded JPEG string with data URI prefix
@@ -224,15 +234,21 @@ class MockCamera:
         Raises:
             RuntimeError: If camera is not open or grab fails
         """
-        img = self.grab_frame()
-
-        # Convert numpy array to PIL Image and encode as JPEG for streaming
-        with BytesIO() as buffer:
-            with Image.fromarray(img) as pil_img:
-                pil_img.save(buffer, format="JPEG", quality=85)
-            base64_data = base64.b64encode(buffer.getvalue()).decode("utf-8")
+        if not self.is_open:
+            raise RuntimeError("Camera is not open")
 
-        return f"data:image/jpeg;base64,{base64_data}"
+        frame_idx = self._current_frame_index()
+        data_uri = self._data_uri_cache.get(frame_idx)
+        if data_uri is None:
+            # Convert numpy array to PIL Image and encode as JPEG for streaming
+            with BytesIO() as buffer:
+                with Image.fromarray(self.test_images[frame_idx]) as pil_img:
+                    pil_img.save(buffer, format="JPEG", quality=85)
+                base64_data = base64.b64encode(buffer.getvalue()).decode("utf-8")
+            data_uri = f"data:image/jpeg;base64,{base64_data}"
+            self._data_uri_cache[frame_idx] = data_uri
+
+        return data_uri
 
 
 async def save_image_async(
@@ -15,16 +15,33 @@ Protocol:
 """
 
 import base64
+import contextlib
+import importlib.util
 import json
 import os
 import sys
 import threading
 import time
+from concurrent.futures import Future, wait
 from io import BytesIO
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from PIL import Image
 
+__all__ = [
+    "CAMERA_AVAILABLE",
+    "DAQ_AVAILABLE",
+    "SCANNER_AVAILABLE",
+    "send_status",
+    "send_error",
+    "send_data",
+    "send_frame",
+    "check_hardware",
+    "detect_cameras",
+    "handle_command",
+    "run_ipc_loop",
+]
+
 # Import version from package
 try:
     from python import __version__
@@ -110,8 +127,20 @@ except ImportError:
         ScannerSettings = None
 
 
+# Upper bound on check_hardware() waiting for both probes (camera and DAQ),
+# in seconds
+HARDWARE_PROBE_TIMEOUT_S = 2.0
+# Device probes started by check_hardware(), keyed by device ("camera",
+# "daq"). A probe still stuck in its driver is waited on again by the next
+# call instead of being started a second time.
+_hardware_probes: Dict[str, Future] = {}
+
 # Global camera instance
 _camera_instance: Optional[Any] = None
+# The camera instance this module last opened and has not closed since.
+# Lets the capture path skip the is_open probe for the common case
+# (same, already-open camera); cleared by close_camera().
+_opened_camera: Optional[Any] = None
 _use_mock_camera = os.environ.get("BLOOM_USE_MOCK_CAMERA", "true").lower() == "true"
 
 # Global DAQ instance
@@ -126,6 +155,13 @@ _use_mock_hardware = os.environ.get("BLOOM_USE_MOCK_HARDWARE", "true").lower() =
 _streaming_thread: Optional[threading.Thread] = None
 _streaming_active = threading.Event()
 _streaming_lock = threading.Lock()
+# Set by streaming_worker() once the current stream has sent
+# FRAMES_EMITTED_THRESHOLD frames; cleared on each start_stream. Lets
+# callers wait for "the stream is producing frames" instead of sleeping.
+FRAMES_EMITTED_THRESHOLD = 3
+_frames_emitted = threading.Event()
+# Streaming frame rate; BLOOM_STREAM_FPS overrides it (read per stream start)
+DEFAULT_STREAM_FPS = 5.0
 
 # Request-id correlation (#47). Set by handle_command() at the top of each
 # dispatch and reset to None once that command completes (success or
@@ -138,6 +174,27 @@ _streaming_lock = threading.Lock()
 # command happens to be in flight on the main thread at that moment.
 _current_request_id: Optional[int] = None
 
+# Serializes protocol output: the streaming thread sends FRAME: lines while
+# the main thread sends its own responses. Held by _send_line() only.
+_stdout_lock = threading.Lock()
+
+
+def _send_line(line: str) -> None:
+    """Write one protocol line to stdout and flush it.
+
+    The line and its newline go out in a single write under _stdout_lock
+    (print() writes them separately), so a FRAME: line from the streaming
+    thread can never land inside a STATUS:/DATA:/ERROR: line. Every send_*
+    function writes through here; direct print() calls elsewhere are not
+    covered.
+
+    Args:
+        line: Protocol line without the trailing newline
+    """
+    with _stdout_lock:
+        sys.stdout.write(f"{line}\n")
+        sys.stdout.flush()
+
 
 def send_status(message: str) -> None:
     """Send a status message to stdout.
@@ -145,7 +202,7 @@ def send_status(message: str) -> None:
     Args:
         message: Status message to send
     """
-    print(f"STATUS:{message}", flush=True)
+    _send_line(f"STATUS:{message}")
 
 
 def send_error(message: str, tag_request: bool = True) -> None:
@@ -162,7 +219,7 @@ def send_error(message: str, tag_request: bool = True) -> None:
     payload: Dict[str, Any] = {"message": message}
     if tag_request and _current_request_id is not None:
         payload["id"] = _current_request_id
-    print(f"ERROR:{json.dumps(payload)}", flush=True)
+    _send_line(f"ERROR:{json.dumps(payload)}")
 
 
 def send_data(data: Dict[str, Any]) -> None:
@@ -178,7 +235,7 @@ def send_data(data: Dict[str, Any]) -> None:
     payload = dict(data)
     if _current_request_id is not None:
         payload["id"] = _current_request_id
-    print(f"DATA:{json.dumps(payload)}", flush=True)
+    _send_line(f"DATA:{json.dumps(payload)}")
 
 
 def send_frame(frame_data: str) -> None:
@@ -187,55 +244,32 @@ def send_frame(frame_data: str) -> None:
     Args:
         frame_data: Base64-encoded image data with data URI prefix
     """
-    print(f"FRAME:{frame_data}", flush=True)
+    _send_line(f"FRAME:{frame_data}")
 
 
-def check_hardware() -> Dict[str, Any]:
-    """Check availability of hardware dependencies and connected devices.
+def _probe_camera() -> Dict[str, Any]:
+    """Import PyPylon and count connected Basler cameras.
+
+    Only called once find_spec() has located pypylon.
 
     Returns:
-        Dictionary with hardware availability status including:
-        - library_available: whether the Python library is installed
-        - devices_found: number of physical devices detected
-        - available: True if library is installed AND devices are found
+        Camera sub-dict for check_hardware().
     """
-    hardware_status = {
-        "camera": {"library_available": False, "devices_found": 0, "available": False},
-        "daq": {"library_available": False, "devices_found": 0, "available": False},
-    }
+    status = {"library_available": True, "devices_found": 0, "available": False}
 
-    # Check PyPylon (Basler cameras)
+    # stderr is not redirected here: the import and TlFactory.GetInstance()
+    # can emit "globbing failed" noise on systems without the Pylon SDK
+    # runtime, so check_hardware() silences fd 2 around both probes.
     try:
-        # Suppress stderr during import to avoid "globbing failed" errors on systems
-        # without Pylon SDK runtime libraries (common in CI environments)
-        stderr_fd = sys.stderr.fileno()
-        with open(os.devnull, "w") as devnull:
-            old_stderr = os.dup(stderr_fd)
-            os.dup2(devnull.fileno(), stderr_fd)
-            try:
-                import pypylon.pylon as pylon
-            finally:
-                os.dup2(old_stderr, stderr_fd)
-                os.close(old_stderr)
-
-        hardware_status["camera"]["library_available"] = True
+        import pypylon.pylon as pylon
 
         # Try to enumerate cameras
-        # Also suppress stderr here as TlFactory.GetInstance() can also emit errors
         try:
-            stderr_fd = sys.stderr.fileno()
-            with open(os.devnull, "w") as devnull:
-                old_stderr = os.dup(stderr_fd)
-                os.dup2(devnull.fileno(), stderr_fd)
-                try:
-                    tlFactory = pylon.TlFactory.GetInstance()
-                    devices = tlFactory.EnumerateDevices()
-                    num_cameras = len(devices)
-                    hardware_status["camera"]["devices_found"] = num_cameras
-                    hardware_status["camera"]["available"] = num_cameras > 0
-                finally:
-                    os.dup2(old_stderr, stderr_fd)
-                    os.close(old_stderr)
+            tlFactory = pylon.TlFactory.GetInstance()
+            devices = tlFactory.EnumerateDevices()
+            num_cameras = len(devices)
+            status["devices_found"] = num_cameras
+            status["available"] = num_cameras > 0
         except Exception:
             # Library available but can't enumerate devices
             # This can happen if:
@@ -244,28 +278,159 @@ def check_hardware() -> Dict[str, Any]:
             # - Permission issues
             pass
     except Exception:
-        # Catch all exceptions including ImportError and runtime errors
-        # pypylon may fail to import or initialize on systems without Pylon SDK
-        pass
+        # Package is installed but failed to import or initialize
+        # (e.g. pypylon on systems without the Pylon SDK runtime)
+        status["library_available"] = False
+
+    return status
+
+
+def _probe_daq() -> Dict[str, Any]:
+    """Import NI-DAQmx and count connected DAQ devices.
+
+    Only called once find_spec() has located nidaqmx.
+
+    Returns:
+        DAQ sub-dict for check_hardware().
+    """
+    status = {"library_available": True, "devices_found": 0, "available": False}
 
-    # Check NI-DAQmx
     try:
         import nidaqmx.system
 
-        hardware_status["daq"]["library_available"] = True
-
         # Try to enumerate DAQ devices
         try:
             system = nidaqmx.system.System.local()
             devices = system.devices
             num_devices = len(devices)
-            hardware_status["daq"]["devices_found"] = num_devices
-            hardware_status["daq"]["available"] = num_devices > 0
+            status["devices_found"] = num_devices
+            status["available"] = num_devices > 0
         except Exception:
             # Library available but can't enumerate devices
             pass
     except ImportError:
-        pass
+        status["library_available"] = False
+
+    return status
+
+
+@contextlib.contextmanager
+def _stderr_suppressed():
+    """Point fd 2 at /dev/null for the duration of the block.
+
+    Redirects at the file-descriptor level so that output from native
+    libraries (Pylon, DAQmx) is silenced too. This is process-wide: it must
+    only be entered on the calling thread, never from a probe thread that
+    may outlive the block. A stderr with no real descriptor (e.g. replaced
+    by a test harness) is left alone.
+    """
+    try:
+        stderr_fd = sys.stderr.fileno()
+    except (AttributeError, OSError, ValueError):
+        yield
+        return
+
+    with open(os.devnull, "w") as devnull:
+        old_stderr = os.dup(stderr_fd)
+        os.dup2(devnull.fileno(), stderr_fd)
+        try:
+            yield
+        finally:
+            os.dup2(old_stderr, stderr_fd)
+            os.close(old_stderr)
+
+
+def _start_probe(name: str, probe: Callable[[], Dict[str, Any]]) -> Future:
+    """Run a device probe on a daemon thread and return its Future.
+
+    If the previous probe for this device is still running (a driver call
+    that never returned), its Future is returned instead of starting another
+    thread, so repeated checks cannot pile up stuck threads.
+
+    A daemon thread (rather than a ThreadPoolExecutor worker, which is
+    joined at interpreter exit) means a driver call that never returns
+    cannot block the backend from shutting down. The trade-off: if the
+    process exits while a probe is still inside native driver code, that
+    thread is torn down mid-call, which some C++ runtimes report as an
+    abort ("FATAL: exception not rethrown" on glibc) instead of a clean exit.
+    """
+    future = _hardware_probes.get(name)
+    if future is not None and not future.done():
+        return future
+
+    future = Future()
+
+    def run() -> None:
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(probe())
+        except BaseException as e:
+            future.set_exception(e)
+
+    _hardware_probes[name] = future
+    threading.Thread(target=run, name=f"{name}-probe", daemon=True).start()
+    return future
+
+
+def check_hardware(enumerate_devices: bool = True) -> Dict[str, Any]:
+    """Check availability of hardware dependencies and connected devices.
+
+    Library availability is answered on the calling thread with
+    importlib.util.find_spec(), which locates the package without executing
+    it. The heavy imports (pypylon loads the Pylon runtime, nidaqmx.system
+    loads the DAQmx driver via ctypes) only happen when devices are actually
+    enumerated.
+
+    The camera and DAQ device probes are both I/O-bound (bus scans, driver
+    IPC), so they run concurrently on daemon threads under one shared
+    deadline of HARDWARE_PROBE_TIMEOUT_S. A probe that has not finished by
+    then is reported with no devices and timed_out set, rather than blocking
+    the IPC loop; its thread is left to finish (or not) in the background.
+    stderr is silenced on the calling thread only while waiting, so it is
+    always restored when this returns.
+
+    Args:
+        enumerate_devices: When False, only report whether each library is
+            installed and skip importing it / scanning for devices. Useful
+            for cheap repeated polling.
+
+    Returns:
+        Dictionary with hardware availability status including:
+        - library_available: whether the Python library is installed
+        - devices_found: number of physical devices detected
+        - available: True if library is installed AND devices are found
+        - timed_out: present (True) only when the device probe did not
+          finish within HARDWARE_PROBE_TIMEOUT_S
+    """
+    probes = {
+        "camera": ("pypylon", _probe_camera),
+        "daq": ("nidaqmx", _probe_daq),
+    }
+    hardware_status = {
+        name: {
+            "library_available": importlib.util.find_spec(package) is not None,
+            "devices_found": 0,
+            "available": False,
+        }
+        for name, (package, _) in probes.items()
+    }
+    if not enumerate_devices:
+        return hardware_status
+
+    with _stderr_suppressed():
+        futures = {
+            name: _start_probe(name, probe)
+            for name, (_, probe) in probes.items()
+            if hardware_status[name]["library_available"]
+        }
+        wait(futures.values(), timeout=HARDWARE_PROBE_TIMEOUT_S)
+
+    for name, future in futures.items():
+        if not future.done():
+            # Slow or hung driver: the library is there, the scan is not done
+            hardware_status[name]["timed_out"] = True
+        elif future.exception() is None:
+            hardware_status[name] = future.result()
 
     return hardware_status
 
@@ -412,8 +577,9 @@ def is_camera_open() -> bool:
 
 def close_camera() -> None:
     """Close the camera instance if it exists."""
-    global _camera_instance
+    global _camera_instance, _opened_camera
 
+    _opened_camera = None
     if _camera_instance is not None:
         try:
             _camera_instance.close()
@@ -423,34 +589,59 @@ def close_camera() -> None:
             _camera_instance = None
 
 
+def _stream_fps() -> float:
+    """Return the streaming frame rate, honoring BLOOM_STREAM_FPS.
+
+    Returns:
+        BLOOM_STREAM_FPS as a float if set to a positive number, otherwise
+        DEFAULT_STREAM_FPS.
+    """
+    try:
+        fps = float(os.environ.get("BLOOM_STREAM_FPS", DEFAULT_STREAM_FPS))
+    except ValueError:
+        return DEFAULT_STREAM_FPS
+    return fps if fps > 0 else DEFAULT_STREAM_FPS
+
+
 def streaming_worker() -> None:
     """Background thread worker for camera streaming.
 
     Continuously captures frames from the camera and sends them via FRAME: protocol
-    while _streaming_active is set. Targets ~5 FPS (200ms per frame).
+    while _streaming_active is set. Targets ~5 FPS (200ms per frame) unless
+    BLOOM_STREAM_FPS says otherwise.
+
+    Frames arrive already encoded from the camera's grab_frame_base64(), so
+    no image objects are built here; MockCamera caches each encoded frame.
     """
-    target_fps = 5
-    frame_interval = 1.0 / target_fps
+    frame_interval = 1.0 / _stream_fps()
+
+    frame_count = 0
+
+    # Bind loop-invariant callables once; the loop body runs every frame.
+    streaming = _streaming_active.is_set
+    clock = time.monotonic
+    sleep = time.sleep
 
     send_status("Streaming worker started")
 
-    while _streaming_active.is_set():
+    while streaming():
         try:
             if not is_camera_open():
                 send_error("Camera not available during streaming", tag_request=False)
                 break
 
             # Capture frame using base64 method
-            frame_start = time.time()
+            frame_start = clock()
             assert _camera_instance is not None  # Checked by is_camera_open()
-            frame_data = _camera_instance.grab_frame_base64()
-            send_frame(frame_data)
+            send_frame(_camera_instance.grab_frame_base64())
+            frame_count += 1
+            if frame_count == FRAMES_EMITTED_THRESHOLD:
+                _frames_emitted.set()
 
             # Maintain target FPS
-            elapsed = time.time() - frame_start
-            sleep_time = max(0, frame_interval - elapsed)
+            sleep_time = frame_interval - (clock() - frame_start)
             if sleep_time > 0:
-                time.sleep(sleep_time)
+                sleep(sleep_time)
 
         except Exception as e:
             send_error(f"Streaming error: {e}", tag_request=False)
@@ -513,7 +704,7 @@ def handle_camera_command(cmd: Dict[str, Any]) -> None:
     Args:
         cmd: Command dictionary with camera parameters
     """
-    global _streaming_thread
+    global _streaming_thread, _opened_camera
 
     if not CAMERA_AVAILABLE:
         send_error("Camera module not available")
@@ -526,6 +717,8 @@ def handle_camera_command(cmd: Dict[str, Any]) -> None:
         if action == "connect":
             camera = get_camera_instance(settings)
             success = camera.open()
+            if success:
+                _opened_camera = camera
             send_data({"success": success, "connected": True})
 
         elif action == "disconnect":
@@ -534,12 +727,17 @@ def handle_camera_command(cmd: Dict[str, Any]) -> None:
 
         elif action == "capture":
             # Use existing camera if already connected, otherwise create/connect
-            if is_camera_open():
-                camera = _camera_instance
+            camera = _camera_instance
+            if camera is not None and camera is _opened_camera:
+                # Fast path: the camera we opened is still current
+                pass
+            elif is_camera_open():
+                _opened_camera = camera
             elif settings:
                 camera = get_camera_instance(settings)
                 if not getattr(camera, "is_open", False):
                     camera.open()
+                _opened_camera = camera
             else:
                 raise RuntimeError(
                     "Camera not connected. Call connect() first or provide settings."
@@ -618,6 +816,7 @@ def handle_camera_command(cmd: Dict[str, Any]) -> None:
                         )
 
                 # Start streaming thread
+                _frames_emitted.clear()
                 _streaming_active.set()
                 _streaming_thread = threading.Thread(
                     target=streaming_worker, daemon=True
@@ -882,6 +1081,43 @@ def handle_scanner_command(cmd: Dict[str, Any]) -> None:
         send_data({"success": False, "error": str(e)})
 
 
+def handle_ping_command(cmd: Dict[str, Any]) -> None:
+    """Handle the ping heartbeat command."""
+    send_data({"status": "ok", "message": "pong"})
+
+
+def handle_version_command(cmd: Dict[str, Any]) -> None:
+    """Handle the get_version command."""
+    send_data({"version": __version__})
+
+
+def handle_check_hardware_command(cmd: Dict[str, Any]) -> None:
+    """Handle the check_hardware command.
+
+    Args:
+        cmd: Command dictionary; optional 'enumerate' (default True)
+            controls whether devices are enumerated.
+    """
+    send_data(check_hardware(cmd.get("enumerate", True)))
+
+
+# Top-level command dispatch table. Keys are interned so that, once an
+# incoming command name is interned too, the lookup compares by identity
+# instead of re-hashing and comparing the freshly-decoded JSON string
+# (ping heartbeats arrive continuously).
+_COMMAND_HANDLERS: Dict[str, Callable[[Dict[str, Any]], None]] = {
+    sys.intern(name): handler
+    for name, handler in {
+        "ping": handle_ping_command,
+        "get_version": handle_version_command,
+        "check_hardware": handle_check_hardware_command,
+        "camera": handle_camera_command,
+        "daq": handle_daq_command,
+        "scanner": handle_scanner_command,
+    }.items()
+}
+
+
 def handle_command(cmd: Dict[str, Any]) -> None:
     """Route and handle incoming commands.
 
@@ -896,26 +1132,13 @@ def handle_command(cmd: Dict[str, Any]) -> None:
     _current_request_id = cmd.get("id")
     try:
         command = cmd.get("command")
+        handler = None
+        if isinstance(command, str):
+            command = sys.intern(command)
+            handler = _COMMAND_HANDLERS.get(command)
 
-        if command == "ping":
-            send_data({"status": "ok", "message": "pong"})
-
-        elif command == "get_version":
-            send_data({"version": __version__})
-
-        elif command == "check_hardware":
-            hardware_status = check_hardware()
-            send_data(hardware_status)
-
-        elif command == "camera":
-            handle_camera_command(cmd)
-
-        elif command == "daq":
-            handle_daq_command(cmd)
-
-        elif command == "scanner":
-            handle_scanner_command(cmd)
-
+        if handler is not None:
+            handler(cmd)
         else:
             send_error(f"Unknown command: {command}")
     finally:
@@ -0,0 +1,20 @@
+"""Helpers for reading IPC protocol lines out of captured stdout."""
+
+from typing import Optional
+
+
+def find_line(output: str, prefix: str) -> Optional[str]:
+    """Return the payload of the first ``prefix`` line in output, or None.
+
+    Uses str.find on the whole buffer rather than splitting it into lines,
+    which during streaming is mostly large base64 FRAME: lines.
+    """
+    if output.startswith(prefix):
+        start = 0
+    else:
+        start = output.find("\n" + prefix) + 1
+        if start == 0:
+            return None
+    start += len(prefix)
+    end = output.find("\n", start)
+    return output[start:] if end == -1 else output[start:end]
@@ -2,17 +2,67 @@
 
 import json
 import pytest
-from unittest.mock import MagicMock
+from dataclasses import dataclass
+from typing import Optional
 import sys
+import types
 import numpy as np
 
-# Mock hardware modules before importing ipc_handler so the
-# `from hardware.*` import path doesn't fail during collection.
+from python.tests.ipc_output import find_line
+
+_MOCK_FRAME = np.zeros((480, 640), dtype=np.uint8)
+_MOCK_FRAME.setflags(write=False)
+
+
+class MockCameraInstance:
+    """Minimal stand-in for Camera/MockCamera used by the IPC handler."""
+
+    def __init__(self, settings):
+        self.settings = settings
+        self.is_open = False
+
+    def open(self):
+        self.is_open = True
+        return True
+
+    def close(self):
+        self.is_open = False
+
+    def grab_frame(self):
+        # Return a simple test image (shared; consumers only read it)
+        return _MOCK_FRAME
+
+    def _configure_camera(self):
+        pass
+
+
+# CameraSettings as a real dataclass so dataclasses.fields() works in
+# get_camera_instance()'s kwargs filter. Must match the real CameraSettings fields.
+@dataclass
+class MockCameraSettings:
+    exposure_time: float
+    gain: int
+    camera_ip_address: Optional[str] = None
+    gamma: float = 1.0
+    num_frames: int = 72
+    seconds_per_rot: float = 7.0
+
+
+# Stub hardware modules before importing ipc_handler so the
+# `from hardware.*` import path doesn't fail during collection. Each stub
+# is a plain module carrying only the name ipc_handler imports from it.
 # These are cleaned up below to prevent contaminating other test files.
+_STUB_ATTRS = {
+    "hardware.camera": ("Camera", MockCameraInstance),
+    "hardware.camera_mock": ("MockCamera", MockCameraInstance),
+    "hardware.camera_types": ("CameraSettings", MockCameraSettings),
+}
 _saved_modules = {}
-for mod_name in ("hardware.camera", "hardware.camera_mock", "hardware.camera_types"):
+for mod_name, (attr, value) in _STUB_ATTRS.items():
     _saved_modules[mod_name] = sys.modules.get(mod_name)
-    sys.modules[mod_name] = MagicMock()
+    stub = types.ModuleType(mod_name)
+    setattr(stub, attr, value)
+    sys.modules[mod_name] = stub
 
 from python.ipc_handler import handle_command  # noqa: E402
 
@@ -24,71 +74,64 @@ for mod_name, original in _saved_modules.items():
         sys.modules[mod_name] = original
 
 
-@pytest.fixture(autouse=True)
-def setup_camera_mocks():
-    """Set up camera mocks for each test.
+def _install_real_camera_classes():
+    """Point ipc_handler back at the real camera classes.
 
-    NOTE: We deliberately avoid monkeypatch for ipc module attributes here.
-    The module-level sys.modules hack (above) means monkeypatch saves MagicMock
-    as the "original" value and restores it AFTER yield cleanup, overwriting
-    our manual restoration of real classes. By setting/restoring directly,
-    we guarantee real classes are restored for subsequent test files.
+    If this module is the first to import ipc_handler, its camera names were
+    bound to the stub classes above. Rebinding them right away (and again
+    at fixture teardown) keeps other test files independent of whether this
+    module's tests ran before theirs, which is what makes the suite safe to
+    split across pytest-xdist workers.
     """
     import python.ipc_handler as ipc
+    from python.hardware.camera import Camera as RealCamera
+    from python.hardware.camera_mock import MockCamera as RealMockCamera
+    from python.hardware.camera_types import CameraSettings as RealCameraSettings
 
-    # Create a mock camera class
-    class MockCameraInstance:
-        def __init__(self, settings):
-            self.settings = settings
-            self.is_open = False
-
-        def open(self):
-            self.is_open = True
-            return True
+    ipc.Camera = RealCamera
+    ipc.MockCamera = RealMockCamera
+    ipc.CameraSettings = RealCameraSettings
+    ipc.CAMERA_AVAILABLE = True
 
-        def close(self):
-            self.is_open = False
 
-        def grab_frame(self):
-            # Return a simple test image
-            return np.zeros((480, 640), dtype=np.uint8)
+_install_real_camera_classes()
 
-        def _configure_camera(self):
-            pass
 
-    # Create CameraSettings as a real dataclass so dataclasses.fields() works
-    # in get_camera_instance()'s kwargs filter. Must match the real CameraSettings fields.
-    from dataclasses import dataclass
-    from typing import Optional
+@pytest.fixture(scope="module", autouse=True)
+def setup_camera_mocks():
+    """Install the mock camera classes on ipc_handler once for this module.
 
-    @dataclass
-    class MockCameraSettings:
-        exposure_time: float
-        gain: int
-        camera_ip_address: Optional[str] = None
-        gamma: float = 1.0
-        num_frames: int = 72
-        seconds_per_rot: float = 7.0
+    NOTE: We deliberately avoid monkeypatch for ipc module attributes here.
+    If ipc_handler's names ever still pointed at the sys.modules stubs
+    (above), monkeypatch would restore those stubs at teardown. By
+    setting/restoring directly, we guarantee real classes are restored for
+    subsequent test files.
+    """
+    import python.ipc_handler as ipc
 
     # Set mocks directly (no monkeypatch)
     ipc.CAMERA_AVAILABLE = True
     ipc.MockCamera = MockCameraInstance
     ipc.Camera = MockCameraInstance
     ipc.CameraSettings = MockCameraSettings
+
+    yield
+
+    # Restore REAL classes (not the stub originals that monkeypatch could restore)
+    _install_real_camera_classes()
+    ipc._camera_instance = None
+
+
+@pytest.fixture(autouse=True)
+def reset_camera_state():
+    """Start and end every test with no global camera instance."""
+    import python.ipc_handler as ipc
+
     ipc._camera_instance = None
     ipc._use_mock_camera = True
 
     yield
 
-    # Restore REAL classes (not the MagicMock originals that monkeypatch would restore)
-    from python.hardware.camera import Camera as RealCamera
-    from python.hardware.camera_mock import MockCamera as RealMockCamera
-    from python.hardware.camera_types import CameraSettings as RealCameraSettings
-
-    ipc.Camera = RealCamera
-    ipc.MockCamera = RealMockCamera
-    ipc.CameraSettings = RealCameraSettings
-    ipc.CAMERA_AVAILABLE = True
     ipc._camera_instance = None
 
 
@@ -103,14 +146,33 @@ def mock_camera_settings():
     }
 
 
+@pytest.fixture
+def connected_ipc(capsys, mock_camera_settings):
+    """Connect the mock camera and discard the connect output.
+
+    Yields the ipc_handler module so tests can inspect its globals. Tests
+    that exercise connect itself keep issuing the command explicitly.
+    """
+    import python.ipc_handler as ipc
+
+    handle_command(
+        {"command": "camera", "action": "connect", "settings": mock_camera_settings}
+    )
+    capsys.readouterr()
+    yield ipc
+
+
 def extract_json_data(output):
-    """Helper to extract JSON data from command output."""
-    lines = output.strip().split("\n")
-    data_lines = [line for line in lines if line.startswith("DATA:")]
-    if not data_lines:
-        return None
-    json_str = data_lines[0][5:].strip()
-    return json.loads(json_str)
+    """Helper to extract JSON data from the first DATA: line of command output."""
+    payload = find_line(output, "DATA:")
+    return None if payload is None else json.loads(payload)
+
+
+def extract_error_message(output):
+    """Helper to extract the message from the first ERROR: line of output."""
+    payload = find_line(output, "ERROR:")
+    assert payload is not None, f"No ERROR: line in output: {output!r}"
+    return json.loads(payload)["message"]
 
 
 class TestCameraStatus:
@@ -127,15 +189,8 @@ class TestCameraStatus:
         assert data["available"] is True
         assert data["mock"] is True
 
-    def test_camera_status_connected(self, capsys, mock_camera_settings):
+    def test_camera_status_connected(self, capsys, connected_ipc):
         """Test status when camera is connected."""
-        # First connect
-        handle_command(
-            {"command": "camera", "action": "connect", "settings": mock_camera_settings}
-        )
-        capsys.readouterr()  # Clear output
-
-        # Then check status
         handle_command({"command": "camera", "action": "status"})
         captured = capsys.readouterr()
 
@@ -186,15 +241,8 @@ class TestCameraConnect:
 class TestCameraDisconnect:
     """Test camera disconnect command."""
 
-    def test_disconnect_when_connected(self, capsys, mock_camera_settings):
+    def test_disconnect_when_connected(self, capsys, connected_ipc):
         """Test disconnecting when camera is connected."""
-        # First connect
-        handle_command(
-            {"command": "camera", "action": "connect", "settings": mock_camera_settings}
-        )
-        capsys.readouterr()  # Clear output
-
-        # Then disconnect
         handle_command({"command": "camera", "action": "disconnect"})
         captured = capsys.readouterr()
 
@@ -213,33 +261,19 @@ class TestCameraDisconnect:
         assert data["success"] is True
         assert data["connected"] is False
 
-    def test_disconnect_clears_instance(self, mock_camera_settings):
+    def test_disconnect_clears_instance(self, connected_ipc):
         """Test that disconnect clears the global camera instance."""
-        import python.ipc_handler as ipc
-
-        # First connect
-        handle_command(
-            {"command": "camera", "action": "connect", "settings": mock_camera_settings}
-        )
-        assert ipc._camera_instance is not None
+        assert connected_ipc._camera_instance is not None
 
-        # Then disconnect
         handle_command({"command": "camera", "action": "disconnect"})
-        assert ipc._camera_instance is None
+        assert connected_ipc._camera_instance is None
 
 
 class TestCameraCapture:
     """Test camera capture command."""
 
-    def test_capture_when_connected(self, capsys, mock_camera_settings):
+    def test_capture_when_connected(self, capsys, connected_ipc):
         """Test capturing image when camera is connected."""
-        # First connect
-        handle_command(
-            {"command": "camera", "action": "connect", "settings": mock_camera_settings}
-        )
-        capsys.readouterr()  # Clear output
-
-        # Then capture
         handle_command({"command": "camera", "action": "capture"})
         captured = capsys.readouterr()
 
@@ -277,36 +311,37 @@ class TestCameraCapture:
         assert data["success"] is True
         assert "image" in data
 
-    def test_capture_reuses_existing_instance(self, mock_camera_settings):
+    def test_capture_reuses_existing_instance(self, connected_ipc):
         """Test that multiple captures reuse the same camera instance."""
-        import python.ipc_handler as ipc
-
-        # First connect
-        handle_command(
-            {"command": "camera", "action": "connect", "settings": mock_camera_settings}
-        )
-        instance_after_connect = ipc._camera_instance
+        instance_after_connect = connected_ipc._camera_instance
 
         # Capture without settings
         handle_command({"command": "camera", "action": "capture"})
-        instance_after_capture = ipc._camera_instance
+        instance_after_capture = connected_ipc._camera_instance
 
         # Should be the same instance
         assert instance_after_connect is instance_after_capture
 
+    def test_capture_fast_path_cleared_on_disconnect(self, capsys, connected_ipc):
+        """Test that disconnect invalidates the already-open capture fast path."""
+        assert connected_ipc._opened_camera is connected_ipc._camera_instance
+
+        handle_command({"command": "camera", "action": "disconnect"})
+        assert connected_ipc._opened_camera is None
+        capsys.readouterr()
+
+        handle_command({"command": "camera", "action": "capture"})
+        data = extract_json_data(capsys.readouterr().out)
+        assert data is not None
+        assert data["success"] is False
+        assert "not connected" in data["error"].lower()
+
 
 class TestCameraConfigure:
     """Test camera configure command."""
 
-    def test_configure_when_connected(self, capsys, mock_camera_settings):
+    def test_configure_when_connected(self, capsys, connected_ipc):
         """Test configuring camera when connected."""
-        # First connect
-        handle_command(
-            {"command": "camera", "action": "connect", "settings": mock_camera_settings}
-        )
-        capsys.readouterr()  # Clear output
-
-        # Then configure
         new_settings = {"exposure_time": 10000, "gain": 15}
         handle_command(
             {"command": "camera", "action": "configure", "settings": new_settings}
@@ -336,17 +371,10 @@ class TestCameraConfigure:
         assert "error" in data
         assert "not connected" in data["error"].lower()
 
-    def test_configure_updates_settings(self, mock_camera_settings):
+    def test_configure_updates_settings(self, connected_ipc):
         """Test that configure updates camera settings."""
-        import python.ipc_handler as ipc
-
-        # First connect
-        handle_command(
-            {"command": "camera", "action": "connect", "settings": mock_camera_settings}
-        )
-
-        original_exposure = ipc._camera_instance.settings.exposure_time
-        original_gain = ipc._camera_instance.settings.gain
+        original_exposure = connected_ipc._camera_instance.settings.exposure_time
+        original_gain = connected_ipc._camera_instance.settings.gain
 
         # Configure with new settings
         new_settings = {"exposure_time": 15000, "gain": 20}
@@ -355,21 +383,16 @@ class TestCameraConfigure:
         )
 
         # Settings should be updated
-        assert ipc._camera_instance.settings.exposure_time == 15000
-        assert ipc._camera_instance.settings.gain == 20
-        assert ipc._camera_instance.settings.exposure_time != original_exposure
-        assert ipc._camera_instance.settings.gain != original_gain
-
-    def test_configure_partial_settings(self, mock_camera_settings):
-        """Test that configure accepts partial settings updates."""
-        import python.ipc_handler as ipc
-
-        # First connect
-        handle_command(
-            {"command": "camera", "action": "connect", "settings": mock_camera_settings}
+        assert connected_ipc._camera_instance.settings.exposure_time == 15000
+        assert connected_ipc._camera_instance.settings.gain == 20
+        assert (
+            connected_ipc._camera_instance.settings.exposure_time != original_exposure
         )
+        assert connected_ipc._camera_instance.settings.gain != original_gain
 
-        original_gain = ipc._camera_instance.settings.gain
+    def test_configure_partial_settings(self, connected_ipc):
+        """Test that configure accepts partial settings updates."""
+        original_gain = connected_ipc._camera_instance.settings.gain
 
         # Configure only exposure_time
         handle_command(
@@ -381,8 +404,8 @@ class TestCameraConfigure:
         )
 
         # Only exposure should change, gain should remain
-        assert ipc._camera_instance.settings.exposure_time == 8000
-        assert ipc._camera_instance.settings.gain == original_gain
+        assert connected_ipc._camera_instance.settings.exposure_time == 8000
+        assert connected_ipc._camera_instance.settings.gain == original_gain
 
 
 class TestCameraErrorHandling:
@@ -490,14 +513,7 @@ class TestCameraUnavailable:
         # Try status command - should return error since module unavailable
         handle_command({"command": "camera", "action": "status"})
         captured = capsys.readouterr()
-        error_line = [
-            line
-            for line in captured.out.strip().split("\n")
-            if line.startswith("ERROR:")
-        ][0]
-        assert json.loads(error_line[len("ERROR:") :])["message"] == (
-            "Camera module not available"
-        )
+        assert extract_error_message(captured.out) == "Camera module not available"
 
         # Try connect command - should return error
         handle_command(
@@ -512,14 +528,7 @@ class TestCameraUnavailable:
             }
         )
         captured = capsys.readouterr()
-        error_line = [
-            line
-            for line in captured.out.strip().split("\n")
-            if line.startswith("ERROR:")
-        ][0]
-        assert json.loads(error_line[len("ERROR:") :])["message"] == (
-            "Camera module not available"
-        )
+        assert extract_error_message(captured.out) == "Camera module not available"
 
 
 class TestMockCameraPathResolution:
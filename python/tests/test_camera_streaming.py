@@ -14,6 +14,7 @@ from PIL import Image
 
 from python.hardware.camera_mock import MockCamera
 from python.hardware.camera_types import CameraSettings
+from python.tests.ipc_output import find_line
 
 
 def parse_data_response(captured_output: str) -> dict:
@@ -25,28 +26,38 @@ def parse_data_response(captured_output: str) -> dict:
     Returns:
         Parsed JSON dictionary from DATA: line
     """
-    for line in captured_output.split("\n"):
-        if line.startswith("DATA:"):
-            json_str = line.split("DATA:", 1)[1].strip()
-            return json.loads(json_str)
-    raise ValueError("No DATA: line found in output")
+    payload = find_line(captured_output, "DATA:")
+    if payload is None:
+        raise ValueError("No DATA: line found in output")
+    return json.loads(payload)
+
+
+@pytest.fixture(scope="module")
+def open_mock_camera():
+    """One opened MockCamera shared by the read-only base64 tests.
+
+    Constructing a MockCamera loads every sample-scan image from disk, and
+    its encoded-frame cache only pays off across calls on the same
+    instance, so build it once per module instead of once per test.
+    """
+    settings = CameraSettings(
+        exposure_time=10000,
+        gain=100,
+        camera_ip_address="192.168.1.100",
+        num_frames=1,
+    )
+    camera = MockCamera(settings)
+    camera.open()
+    yield camera
+    camera.close()
 
 
 class TestGrabFrameBase64:
     """Test base64 frame encoding for Camera and MockCamera."""
 
-    def test_mock_camera_grab_frame_base64_returns_data_uri(self):
+    def test_mock_camera_grab_frame_base64_returns_data_uri(self, open_mock_camera):
         """Verify MockCamera.grab_frame_base64() returns valid data URI."""
-        settings = CameraSettings(
-            exposure_time=10000,
-            gain=100,
-            camera_ip_address="192.168.1.100",
-            num_frames=1,
-        )
-        camera = MockCamera(settings)
-        camera.open()
-
-        result = camera.grab_frame_base64()
+        result = open_mock_camera.grab_frame_base64()
 
         # Should be a string
         assert isinstance(result, str)
@@ -68,18 +79,9 @@ class TestGrabFrameBase64:
         except Exception as e:
             pytest.fail(f"Invalid base64 data: {e}")
 
-    def test_mock_camera_base64_is_valid_jpeg(self):
+    def test_mock_camera_base64_is_valid_jpeg(self, open_mock_camera):
         """Verify MockCamera base64 can be decoded back to JPEG image."""
-        settings = CameraSettings(
-            exposure_time=10000,
-            gain=100,
-            camera_ip_address="192.168.1.100",
-            num_frames=1,
-        )
-        camera = MockCamera(settings)
-        camera.open()
-
-        result = camera.grab_frame_base64()
+        result = open_mock_camera.grab_frame_base64()
         base64_part = result.split(",", 1)[1]
         decoded = base64.b64decode(base64_part)
 
@@ -92,18 +94,9 @@ class TestGrabFrameBase64:
         except Exception as e:
             pytest.fail(f"Cannot decode as JPEG: {e}")
 
-    def test_base64_output_format(self):
+    def test_base64_output_format(self, open_mock_camera):
         """Verify output format matches: 'data:image/jpeg;base64,{data}'."""
-        settings = CameraSettings(
-            exposure_time=10000,
-            gain=100,
-            camera_ip_address="192.168.1.100",
-            num_frames=1,
-        )
-        camera = MockCamera(settings)
-        camera.open()
-
-        result = camera.grab_frame_base64()
+        result = open_mock_camera.grab_frame_base64()
 
         # Exact format check
         assert result.startswith("data:image/jpeg;base64,")
@@ -111,24 +104,24 @@ class TestGrabFrameBase64:
         assert len(parts) == 2
         assert parts[0] == "data:image/jpeg;base64"
 
-    def test_grab_frame_base64_no_resource_leak(self):
+    def test_grab_frame_base64_no_resource_leak(self, open_mock_camera, monkeypatch):
         """Verify grab_frame_base64 does not leak file handles (context managers)."""
         import warnings
 
-        settings = CameraSettings(
-            exposure_time=10000,
-            gain=100,
-            camera_ip_address="192.168.1.100",
-            num_frames=1,
-        )
-        camera = MockCamera(settings)
-        camera.open()
+        camera = open_mock_camera
+        frame_idx = 0
+        monkeypatch.setattr(camera, "_current_frame_index", lambda: frame_idx)
 
-        # Call multiple times and check for ResourceWarning
+        # Call multiple times and check for ResourceWarning. The encoded-frame
+        # cache is cleared and the frame varied on every call, so each grab
+        # really goes through the BytesIO/Image encode path.
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
-            for _ in range(50):
+            for i in range(50):
+                frame_idx = i % len(camera.test_images)
+                camera._data_uri_cache.clear()
                 camera.grab_frame_base64()
+                assert frame_idx in camera._data_uri_cache
 
             resource_warnings = [
                 x for x in w if issubclass(x.category, ResourceWarning)
@@ -137,6 +130,20 @@ class TestGrabFrameBase64:
                 len(resource_warnings) == 0
             ), f"Got ResourceWarnings: {resource_warnings}"
 
+    def test_grab_frame_base64_caches_encoded_frames(
+        self, open_mock_camera, monkeypatch
+    ):
+        """Verify each mock frame is encoded once and reused on later grabs."""
+        monkeypatch.setattr(open_mock_camera, "_current_frame_index", lambda: 0)
+        first = open_mock_camera.grab_frame_base64()
+        second = open_mock_camera.grab_frame_base64()
+        assert second is first
+
+        monkeypatch.setattr(open_mock_camera, "_current_frame_index", lambda: 1)
+        other = open_mock_camera.grab_frame_base64()
+        assert other.startswith("data:image/jpeg;base64,")
+        assert other != first
+
     def test_grab_frame_base64_requires_open_camera(self):
         """Verify grab_frame_base64() raises error if camera not open."""
         settings = CameraSettings(
@@ -207,11 +214,16 @@ class TestStreamingIPCActions:
         ipc._camera_instance = None
         ipc._streaming_thread = None
         ipc._streaming_active.clear()
+        ipc._frames_emitted.clear()
 
-        # Ensure we use mock camera
+        # Ensure we use mock camera, streaming fast so frames arrive quickly
         monkeypatch.setenv("BLOOM_USE_MOCK_CAMERA", "true")
+        monkeypatch.setenv("BLOOM_STREAM_FPS", "50")
 
-        # Capture stdout for protocol message verification
+        # Capture stdout for protocol message verification. capsys is already
+        # an in-memory sys.stdout capture (no fd pipe), and a sys.stdout swap
+        # made here would be overwritten when pytest resumes its own capture
+        # for the test call phase, so capsys is the sink to use.
         self.capsys = capsys
         self.ipc = ipc
 
@@ -296,30 +308,24 @@ class TestStreamingIPCActions:
         }
 
         handle_command(command)
-        self.capsys.readouterr()  # Clear startup messages
 
-        # Wait for frames to be sent (should get ~7 frames in 1.5s at 5 FPS)
-        time.sleep(1.5)
+        # Wait until the worker reports its first frames (~60ms at 50 FPS)
+        assert self.ipc._frames_emitted.wait(timeout=5.0), "No frames emitted"
         captured = self.capsys.readouterr()
 
         # Should see FRAME: protocol messages
         assert "FRAME:" in captured.out
-        # Should have frames at ~5 FPS rate (not 30 FPS)
         frame_count = captured.out.count("FRAME:")
-        assert frame_count >= 3, f"Expected at least 3 frames, got {frame_count}"
         assert (
-            frame_count <= 15
-        ), f"Expected at most 15 frames (5 FPS), got {frame_count}"
+            frame_count >= self.ipc.FRAMES_EMITTED_THRESHOLD
+        ), f"Expected at least 3 frames, got {frame_count}"
 
         # Verify FRAME data is JPEG, not PNG
-        frame_lines = [
-            line for line in captured.out.split("\n") if line.startswith("FRAME:")
-        ]
-        if frame_lines:
-            frame_data = frame_lines[0][len("FRAME:") :]
-            assert frame_data.startswith(
-                "data:image/jpeg;base64,"
-            ), f"Expected JPEG data URI, got: {frame_data[:40]}"
+        frame_data = find_line(captured.out, "FRAME:")
+        assert frame_data is not None, "No FRAME: line in output"
+        assert frame_data.startswith(
+            "data:image/jpeg;base64,"
+        ), f"Expected JPEG data URI, got: {frame_data[:40]}"
 
     def test_stop_stream_stops_thread(self):
         """Verify stop_stream signals worker to exit."""
@@ -408,8 +414,10 @@ class TestStreamingWorkflow:
         ipc._camera_instance = None
         ipc._streaming_thread = None
         ipc._streaming_active.clear()
+        ipc._frames_emitted.clear()
 
         monkeypatch.setenv("BLOOM_USE_MOCK_CAMERA", "true")
+        monkeypatch.setenv("BLOOM_STREAM_FPS", "50")
 
         self.capsys = capsys
         self.ipc = ipc
@@ -424,10 +432,13 @@ class TestStreamingWorkflow:
         ipc._camera_instance = None
         ipc._streaming_thread = None
 
-    def test_start_stream_stop_stream_lifecycle(self):
+    def test_start_stream_stop_stream_lifecycle(self, monkeypatch):
         """Verify complete start → frames → stop workflow."""
         from python.ipc_handler import handle_command
 
+        # A rate low enough that the upper bound below checks the FPS cap
+        monkeypatch.setenv("BLOOM_STREAM_FPS", "20")
+
         # Start streaming
         start_cmd = {
             "command": "camera",
@@ -443,28 +454,33 @@ class TestStreamingWorkflow:
         self.capsys.readouterr()  # Clear startup messages
 
         # Wait for frames
-        time.sleep(1.5)  # Should get ~7 frames at 5 FPS
+        time.sleep(0.5)  # Should get ~10 frames at 20 FPS
         captured = self.capsys.readouterr()
         frame_count = captured.out.count("FRAME:")
         assert frame_count >= 3, f"Expected at least 3 frames, got {frame_count}"
         assert (
             frame_count <= 15
-        ), f"Expected at most 15 frames (5 FPS), got {frame_count}"
+        ), f"Expected at most 15 frames (20 FPS), got {frame_count}"
 
         # Stop streaming
         stop_cmd = {"command": "camera", "action": "stop_stream"}
         handle_command(stop_cmd)
         self.capsys.readouterr()
 
-        # Wait a bit to ensure no more frames
-        time.sleep(0.3)
+        # Wait a few frame intervals to ensure no more frames
+        time.sleep(0.15)
         captured = self.capsys.readouterr()
 
         # Should have no FRAME: messages after stopping
         assert "FRAME:" not in captured.out
 
-    def test_multiple_start_stop_cycles(self):
-        """Verify streaming can be started and stopped multiple times."""
+    @pytest.mark.parametrize("cycles", [1, 3], ids=["single", "repeated"])
+    def test_multiple_start_stop_cycles(self, cycles):
+        """Verify streaming can be started and stopped multiple times.
+
+        The single-cycle case isolates a plain start/stop failure from one
+        that only shows up when restarting after a stop.
+        """
         from python.ipc_handler import handle_command
 
         command = {
@@ -478,23 +494,23 @@ class TestStreamingWorkflow:
             },
         }
 
-        for cycle in range(3):
+        for cycle in range(cycles):
             # Start streaming
             handle_command(command)
-            self.capsys.readouterr()
 
             # Wait for frames
-            time.sleep(0.3)
+            assert self.ipc._frames_emitted.wait(
+                timeout=5.0
+            ), f"Cycle {cycle}: No frames during streaming"
             captured = self.capsys.readouterr()
             assert (
                 "FRAME:" in captured.out
             ), f"Cycle {cycle}: No frames during streaming"
 
-            # Stop streaming
+            # Stop streaming (joins the worker thread before returning)
             handle_command({"command": "camera", "action": "stop_stream"})
             self.capsys.readouterr()
 
             # Verify stopped
-            time.sleep(0.2)
             captured = self.capsys.readouterr()
             assert "FRAME:" not in captured.out, f"Cycle {cycle}: Frames after stopping"
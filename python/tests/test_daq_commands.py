@@ -1,10 +1,12 @@
 """Tests for DAQ IPC command handling."""
 
 import json
-from io import StringIO
+import re
+from types import MappingProxyType
 
 import pytest
 
+from python import ipc_handler
 from python.ipc_handler import (
     DAQ_AVAILABLE,
     cleanup_daq,
@@ -12,12 +14,8 @@ from python.ipc_handler import (
     handle_command,
 )
 
-
-# Test fixtures for DAQ settings
-@pytest.fixture
-def valid_daq_settings():
-    """Valid DAQ settings for testing."""
-    return {
+VALID_DAQ_SETTINGS = MappingProxyType(
+    {
         "device_name": "TestDAQ1",
         "sampling_rate": 40000,
         "step_pin": 0,
@@ -26,6 +24,38 @@ def valid_daq_settings():
         "num_frames": 72,
         "seconds_per_rot": 36.0,
     }
+)
+
+# Fixed commands shared by all tests; read-only so no test can alter another's
+CMDS = MappingProxyType(
+    {
+        "init": MappingProxyType(
+            {"command": "daq", "action": "initialize", "settings": VALID_DAQ_SETTINGS}
+        ),
+        "status": MappingProxyType({"command": "daq", "action": "status"}),
+        "home": MappingProxyType({"command": "daq", "action": "home"}),
+        "cleanup": MappingProxyType({"command": "daq", "action": "cleanup"}),
+    }
+)
+
+
+def rotate_cmd(degrees):
+    """Build a rotate command for the given angle."""
+    return {"command": "daq", "action": "rotate", "degrees": degrees}
+
+
+# Test fixtures for DAQ settings
+@pytest.fixture(scope="session")
+def valid_daq_settings():
+    """Valid DAQ settings for testing (read-only, shared by all tests)."""
+    return VALID_DAQ_SETTINGS
+
+
+@pytest.fixture
+def initialized_daq(capsys):
+    """Initialize the mock DAQ and discard the initialize output."""
+    handle_command(CMDS["init"])
+    capsys.readouterr()
 
 
 @pytest.fixture
@@ -34,95 +64,80 @@ def minimal_daq_settings():
     return {}  # Will use defaults from DAQSettings
 
 
+@pytest.fixture(scope="module", autouse=True)
+def use_mock_daq():
+    """Force use of mock DAQ for all tests, starting from no DAQ instance."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(ipc_handler, "_use_mock_daq", True)
+        cleanup_daq()
+        yield
+        cleanup_daq()
+
+
 @pytest.fixture(autouse=True)
-def reset_daq_instance():
-    """Reset the global DAQ instance before each test."""
-    cleanup_daq()
+def reset_daq_instance(use_mock_daq):
+    """Clean up the global DAQ instance after each test.
+
+    use_mock_daq starts the module with no instance, and every test cleans
+    up after itself, so no cleanup is needed before the test.
+    """
     yield
     cleanup_daq()
 
 
-@pytest.fixture(autouse=True)
-def use_mock_daq(monkeypatch):
-    """Force use of mock DAQ for all tests."""
-    from python import ipc_handler
+_DATA_RE = re.compile(r"^DATA:(.*)$", re.M)
+
 
-    monkeypatch.setattr(ipc_handler, "_use_mock_daq", True)
+def parse_all_data(text):
+    """Return every DATA: response in text as a list of dicts."""
+    return [json.loads(m.group(1)) for m in _DATA_RE.finditer(text)]
+
+
+def parse_data(capsys):
+    """Drain captured stdout and return the first DATA: response as a dict."""
+    return json.loads(_DATA_RE.search(capsys.readouterr().out).group(1))
 
 
 class TestDAQStatus:
     """Tests for DAQ status command."""
 
-    def test_daq_status_not_initialized(self, monkeypatch, valid_daq_settings):
+    def test_daq_status_not_initialized(self, capsys, valid_daq_settings):
         """Test status when DAQ is not initialized."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
-        cmd = {"command": "daq", "action": "status"}
-        handle_command(cmd)
+        handle_command(CMDS["status"])
 
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
+        response = parse_data(capsys)
 
-        assert response["success"] is True
-        assert response["initialized"] is False
-        assert response["position"] == 0.0
-        assert response["mock"] is True
-        assert response["available"] == DAQ_AVAILABLE
-
-    def test_daq_status_initialized(self, monkeypatch, valid_daq_settings):
-        """Test status when DAQ is initialized."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
-        # Initialize first
-        init_cmd = {
-            "command": "daq",
-            "action": "initialize",
-            "settings": valid_daq_settings,
+        expected = {
+            "success": True,
+            "initialized": False,
+            "position": 0.0,
+            "mock": True,
+            "available": DAQ_AVAILABLE,
         }
-        handle_command(init_cmd)
-
-        # Clear output
-        output.truncate(0)
-        output.seek(0)
+        assert expected.items() <= response.items()
 
+    def test_daq_status_initialized(self, capsys, initialized_daq):
+        """Test status when DAQ is initialized."""
         # Check status
-        status_cmd = {"command": "daq", "action": "status"}
-        handle_command(status_cmd)
+        handle_command(CMDS["status"])
 
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
+        response = parse_data(capsys)
 
-        assert response["success"] is True
-        assert response["initialized"] is True
-        assert response["position"] == 0.0
-        assert response["mock"] is True
+        expected = {"success": True, "initialized": True, "position": 0.0, "mock": True}
+        assert expected.items() <= response.items()
 
 
 class TestDAQInitialize:
     """Tests for DAQ initialize command."""
 
-    def test_initialize_with_valid_settings(self, monkeypatch, valid_daq_settings):
+    def test_initialize_with_valid_settings(self, capsys):
         """Test initializing DAQ with valid settings."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
-        cmd = {
-            "command": "daq",
-            "action": "initialize",
-            "settings": valid_daq_settings,
-        }
-        handle_command(cmd)
+        handle_command(CMDS["init"])
 
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
+        response = parse_data(capsys)
 
-        assert response["success"] is True
-        assert response["initialized"] is True
+        expected = {"success": True, "initialized": True}
+        assert expected.items() <= response.items()
 
     def test_initialize_creates_daq_instance(self, valid_daq_settings):
         """Test that initialize creates a DAQ instance."""
@@ -132,67 +147,38 @@ class TestDAQInitialize:
         assert daq is not None
         assert daq.is_initialized is True
 
-    def test_initialize_with_defaults(self, monkeypatch):
+    def test_initialize_with_defaults(self, capsys):
         """Test initializing DAQ with default settings."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
         cmd = {"command": "daq", "action": "initialize", "settings": {}}
         handle_command(cmd)
 
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
+        response = parse_data(capsys)
 
-        assert response["success"] is True
-        assert response["initialized"] is True
+        expected = {"success": True, "initialized": True}
+        assert expected.items() <= response.items()
 
 
 class TestDAQCleanup:
     """Tests for DAQ cleanup command."""
 
-    def test_cleanup_when_initialized(self, monkeypatch, valid_daq_settings):
+    def test_cleanup_when_initialized(self, capsys, initialized_daq):
         """Test cleanup when DAQ is initialized."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
-        # Initialize first
-        init_cmd = {
-            "command": "daq",
-            "action": "initialize",
-            "settings": valid_daq_settings,
-        }
-        handle_command(init_cmd)
-
-        # Clear output
-        output.truncate(0)
-        output.seek(0)
-
         # Cleanup
-        cleanup_cmd = {"command": "daq", "action": "cleanup"}
-        handle_command(cleanup_cmd)
+        handle_command(CMDS["cleanup"])
 
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
+        response = parse_data(capsys)
 
-        assert response["success"] is True
-        assert response["initialized"] is False
+        expected = {"success": True, "initialized": False}
+        assert expected.items() <= response.items()
 
-    def test_cleanup_when_not_initialized(self, monkeypatch):
+    def test_cleanup_when_not_initialized(self, capsys):
         """Test cleanup when DAQ is not initialized."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
-        cleanup_cmd = {"command": "daq", "action": "cleanup"}
-        handle_command(cleanup_cmd)
+        handle_command(CMDS["cleanup"])
 
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
+        response = parse_data(capsys)
 
-        assert response["success"] is True
-        assert response["initialized"] is False
+        expected = {"success": True, "initialized": False}
+        assert expected.items() <= response.items()
 
     def test_cleanup_clears_instance(self, valid_daq_settings):
         """Test that cleanup clears the DAQ instance."""
@@ -211,284 +197,115 @@ class TestDAQCleanup:
 class TestDAQRotate:
     """Tests for DAQ rotate command."""
 
-    def test_rotate_when_initialized(self, monkeypatch, valid_daq_settings):
-        """Test rotating when DAQ is initialized."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
-        # Initialize first
-        init_cmd = {
-            "command": "daq",
-            "action": "initialize",
-            "settings": valid_daq_settings,
-        }
-        handle_command(init_cmd)
-
-        # Clear output
-        output.truncate(0)
-        output.seek(0)
-
-        # Rotate
-        rotate_cmd = {"command": "daq", "action": "rotate", "degrees": 90.0}
-        handle_command(rotate_cmd)
-
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
-
-        assert response["success"] is True
-        assert response["position"] == 90.0
-
-    def test_rotate_when_not_initialized(self, monkeypatch):
-        """Test rotating when DAQ is not initialized fails."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
-        rotate_cmd = {"command": "daq", "action": "rotate", "degrees": 90.0}
-        handle_command(rotate_cmd)
-
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
-
-        assert response["success"] is False
-        assert "not initialized" in response["error"].lower()
-
-    def test_rotate_without_degrees(self, monkeypatch, valid_daq_settings):
+    def test_rotate_without_degrees(self, capsys, initialized_daq):
         """Test rotating without degrees parameter fails."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
-        # Initialize first
-        init_cmd = {
-            "command": "daq",
-            "action": "initialize",
-            "settings": valid_daq_settings,
-        }
-        handle_command(init_cmd)
-
-        # Clear output
-        output.truncate(0)
-        output.seek(0)
-
         # Rotate without degrees
-        rotate_cmd = {"command": "daq", "action": "rotate"}
-        handle_command(rotate_cmd)
+        cmd = {"command": "daq", "action": "rotate"}
+        handle_command(cmd)
 
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
+        response = parse_data(capsys)
 
         assert response["success"] is False
         assert "degrees parameter required" in response["error"]
 
-    def test_rotate_negative_degrees(self, monkeypatch, valid_daq_settings):
-        """Test rotating with negative degrees (counter-clockwise)."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
-        # Initialize first
-        init_cmd = {
-            "command": "daq",
-            "action": "initialize",
-            "settings": valid_daq_settings,
-        }
-        handle_command(init_cmd)
-
-        # Clear output
-        output.truncate(0)
-        output.seek(0)
-
-        # Rotate counter-clockwise
-        rotate_cmd = {"command": "daq", "action": "rotate", "degrees": -45.0}
-        handle_command(rotate_cmd)
-
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
-
-        assert response["success"] is True
-        assert response["position"] == 315.0  # -45 wraps to 315
-
 
 class TestDAQStep:
     """Tests for DAQ step command."""
 
-    def test_step_when_initialized(self, monkeypatch, valid_daq_settings):
-        """Test stepping when DAQ is initialized."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
-        # Initialize first
-        init_cmd = {
-            "command": "daq",
-            "action": "initialize",
-            "settings": valid_daq_settings,
-        }
-        handle_command(init_cmd)
-
-        # Clear output
-        output.truncate(0)
-        output.seek(0)
-
-        # Step
-        step_cmd = {
-            "command": "daq",
-            "action": "step",
-            "num_steps": 100,
-            "direction": 1,
-        }
-        handle_command(step_cmd)
-
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
-
-        assert response["success"] is True
-        assert response["position"] > 0.0
-
-    def test_step_when_not_initialized(self, monkeypatch):
-        """Test stepping when DAQ is not initialized fails."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
-        step_cmd = {"command": "daq", "action": "step", "num_steps": 100}
-        handle_command(step_cmd)
-
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
-
-        assert response["success"] is False
-        assert "not initialized" in response["error"].lower()
-
-    def test_step_without_num_steps(self, monkeypatch, valid_daq_settings):
+    def test_step_without_num_steps(self, capsys, initialized_daq):
         """Test stepping without num_steps parameter fails."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
-        # Initialize first
-        init_cmd = {
-            "command": "daq",
-            "action": "initialize",
-            "settings": valid_daq_settings,
-        }
-        handle_command(init_cmd)
-
-        # Clear output
-        output.truncate(0)
-        output.seek(0)
-
         # Step without num_steps
-        step_cmd = {"command": "daq", "action": "step"}
-        handle_command(step_cmd)
+        cmd = {"command": "daq", "action": "step"}
+        handle_command(cmd)
 
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
+        response = parse_data(capsys)
 
         assert response["success"] is False
         assert "num_steps parameter required" in response["error"]
 
-    def test_step_counter_clockwise(self, monkeypatch, valid_daq_settings):
-        """Test stepping counter-clockwise."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
-        # Initialize first
-        init_cmd = {
-            "command": "daq",
-            "action": "initialize",
-            "settings": valid_daq_settings,
-        }
-        handle_command(init_cmd)
-
-        # Clear output
-        output.truncate(0)
-        output.seek(0)
-
-        # Step counter-clockwise
-        step_cmd = {
-            "command": "daq",
-            "action": "step",
-            "num_steps": 100,
-            "direction": -1,
-        }
-        handle_command(step_cmd)
-
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
-
-        assert response["success"] is True
-        # Position should wrap around
-        assert response["position"] > 350.0
-
 
 class TestDAQHome:
     """Tests for DAQ home command."""
 
-    def test_home_when_initialized(self, monkeypatch, valid_daq_settings):
+    def test_home_when_initialized(self, capsys, initialized_daq):
         """Test homing when DAQ is initialized."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
-        # Initialize first
-        init_cmd = {
-            "command": "daq",
-            "action": "initialize",
-            "settings": valid_daq_settings,
-        }
-        handle_command(init_cmd)
-
         # Rotate away from home
-        rotate_cmd = {"command": "daq", "action": "rotate", "degrees": 180.0}
-        handle_command(rotate_cmd)
+        handle_command(rotate_cmd(180.0))
 
         # Clear output
-        output.truncate(0)
-        output.seek(0)
+        capsys.readouterr()
 
         # Home
-        home_cmd = {"command": "daq", "action": "home"}
-        handle_command(home_cmd)
+        handle_command(CMDS["home"])
 
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
+        response = parse_data(capsys)
 
-        assert response["success"] is True
-        assert response["position"] == 0.0
+        expected = {"success": True, "position": 0.0}
+        assert expected.items() <= response.items()
 
-    def test_home_when_not_initialized(self, monkeypatch):
-        """Test homing when DAQ is not initialized fails."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
 
-        home_cmd = {"command": "daq", "action": "home"}
-        handle_command(home_cmd)
+class TestDAQMotion:
+    """Tests shared by the rotate, step and home commands."""
+
+    @pytest.mark.parametrize(
+        "cmd",
+        [
+            rotate_cmd(90.0),
+            {"command": "daq", "action": "step", "num_steps": 100},
+            CMDS["home"],
+        ],
+        ids=["rotate", "step", "home"],
+    )
+    def test_action_requires_init(self, capsys, cmd):
+        """Test that motion commands fail when DAQ is not initialized."""
+        handle_command(cmd)
 
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
+        response = parse_data(capsys)
 
         assert response["success"] is False
         assert "not initialized" in response["error"].lower()
 
+    @pytest.mark.parametrize(
+        "action_cmd, expected_position",
+        [
+            (rotate_cmd(90.0), 90.0),
+            # -45 wraps to 315
+            (rotate_cmd(-45.0), 315.0),
+            # 100 of 6400 steps per revolution is 5.625 degrees
+            (
+                {"command": "daq", "action": "step", "num_steps": 100, "direction": 1},
+                5.625,
+            ),
+            # Counter-clockwise steps wrap around below 360
+            (
+                {"command": "daq", "action": "step", "num_steps": 100, "direction": -1},
+                354.375,
+            ),
+        ],
+        ids=["rotate", "rotate-negative", "step", "step-counter-clockwise"],
+    )
+    def test_action_when_initialized(
+        self, capsys, initialized_daq, action_cmd, expected_position
+    ):
+        """Test that motion commands report the new position once initialized."""
+        handle_command(action_cmd)
+
+        response = parse_data(capsys)
+
+        assert response["success"] is True
+        assert response["position"] == pytest.approx(expected_position)
+
 
 class TestDAQErrorHandling:
     """Tests for DAQ error handling."""
 
-    def test_unknown_daq_action(self, monkeypatch):
+    def test_unknown_daq_action(self, capsys):
         """Test handling unknown DAQ action."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
         cmd = {"command": "daq", "action": "invalid_action"}
         handle_command(cmd)
 
-        lines = output.getvalue().strip().split("\n")
-        error_line = [line for line in lines if line.startswith("ERROR:")][0]
+        lines = capsys.readouterr().out.splitlines()
+        error_line = next(line for line in lines if line.startswith("ERROR:"))
 
         assert "Unknown DAQ action" in error_line
 
@@ -496,113 +313,69 @@ class TestDAQErrorHandling:
 class TestDAQWorkflow:
     """Tests for complete DAQ workflows."""
 
-    def test_complete_workflow(self, monkeypatch, valid_daq_settings):
+    def test_complete_workflow(self, capsys):
         """Test a complete DAQ workflow: initialize -> rotate -> home -> cleanup."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
         # 1. Initialize
-        init_cmd = {
-            "command": "daq",
-            "action": "initialize",
-            "settings": valid_daq_settings,
-        }
-        handle_command(init_cmd)
+        handle_command(CMDS["init"])
 
         # 2. Rotate
-        rotate_cmd = {"command": "daq", "action": "rotate", "degrees": 90.0}
-        handle_command(rotate_cmd)
+        handle_command(rotate_cmd(90.0))
 
         # 3. Home
-        home_cmd = {"command": "daq", "action": "home"}
-        handle_command(home_cmd)
+        handle_command(CMDS["home"])
 
         # 4. Cleanup
-        cleanup_cmd = {"command": "daq", "action": "cleanup"}
-        handle_command(cleanup_cmd)
+        handle_command(CMDS["cleanup"])
 
         # Verify all succeeded
-        lines = output.getvalue().strip().split("\n")
-        data_lines = [line for line in lines if line.startswith("DATA:")]
+        responses = parse_all_data(capsys.readouterr().out)
 
-        assert len(data_lines) == 4
-        for line in data_lines:
-            response = json.loads(line[5:])
+        assert len(responses) == 4
+        for response in responses:
             assert response["success"] is True
 
-    def test_status_reflects_state_changes(self, monkeypatch, valid_daq_settings):
+    def test_status_reflects_state_changes(self, capsys):
         """Test that status reflects DAQ state changes."""
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
         # Check initial status
-        status_cmd = {"command": "daq", "action": "status"}
+        status_cmd = CMDS["status"]
         handle_command(status_cmd)
 
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
+        response = parse_data(capsys)
         assert response["initialized"] is False
 
         # Initialize
-        output.truncate(0)
-        output.seek(0)
-        init_cmd = {
-            "command": "daq",
-            "action": "initialize",
-            "settings": valid_daq_settings,
-        }
-        handle_command(init_cmd)
+        handle_command(CMDS["init"])
 
         # Check status after init
-        output.truncate(0)
-        output.seek(0)
+        capsys.readouterr()
         handle_command(status_cmd)
 
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
-        assert response["initialized"] is True
-        assert response["position"] == 0.0
+        response = parse_data(capsys)
+        expected = {"initialized": True, "position": 0.0}
+        assert expected.items() <= response.items()
 
         # Rotate
-        output.truncate(0)
-        output.seek(0)
-        rotate_cmd = {"command": "daq", "action": "rotate", "degrees": 45.0}
-        handle_command(rotate_cmd)
+        handle_command(rotate_cmd(45.0))
 
         # Check status after rotate
-        output.truncate(0)
-        output.seek(0)
+        capsys.readouterr()
         handle_command(status_cmd)
 
-        lines = output.getvalue().strip().split("\n")
-        data_line = [line for line in lines if line.startswith("DATA:")][0]
-        response = json.loads(data_line[5:])
+        response = parse_data(capsys)
         assert response["position"] == 45.0
 
 
 class TestDAQUnavailable:
     """Tests for DAQ unavailable scenarios."""
 
-    def test_daq_commands_when_unavailable(self, monkeypatch):
+    def test_daq_commands_when_unavailable(self, monkeypatch, capsys):
         """Test DAQ commands when DAQ module is unavailable."""
         # Mock DAQ as unavailable
-        from python import ipc_handler
-
-        original_available = ipc_handler.DAQ_AVAILABLE
         monkeypatch.setattr(ipc_handler, "DAQ_AVAILABLE", False)
 
-        output = StringIO()
-        monkeypatch.setattr("sys.stdout", output)
-
-        cmd = {"command": "daq", "action": "status"}
-        handle_command(cmd)
+        handle_command(CMDS["status"])
 
-        lines = output.getvalue().strip().split("\n")
-        error_line = [line for line in lines if line.startswith("ERROR:")][0]
+        lines = capsys.readouterr().out.splitlines()
+        error_line = next(line for line in lines if line.startswith("ERROR:"))
 
         assert "DAQ module not available" in error_line
-
-        # Restore
-        monkeypatch.setattr(ipc_handler, "DAQ_AVAILABLE", original_available)
@@ -1,5 +1,9 @@
 """Tests for hardware module import fallback mechanism."""
 
+from types import SimpleNamespace
+
+import pytest
+
 
 def test_camera_imports_bundled_path():
     """Test that camera modules can import from bundled path (hardware.*)."""
@@ -70,54 +74,51 @@ def test_ipc_handler_imports_with_fallback():
     assert DAQ_AVAILABLE is True, "DAQ modules should be available via fallback import"
 
 
-def test_camera_module_attributes():
-    """Test that imported camera modules have expected attributes."""
+@pytest.fixture(scope="session")
+def hw_modules():
+    """Hardware classes imported once from the development path."""
     from python.hardware.camera import Camera
     from python.hardware.camera_mock import MockCamera
     from python.hardware.camera_types import CameraSettings
-
-    # Check that Camera class has expected methods
-    assert hasattr(Camera, "__init__")
-    assert hasattr(Camera, "open")
-    assert hasattr(Camera, "close")
-    assert hasattr(Camera, "grab_frame")
-
-    # Check MockCamera
-    assert hasattr(MockCamera, "__init__")
-    assert hasattr(MockCamera, "open")
-    assert hasattr(MockCamera, "close")
-    assert hasattr(MockCamera, "grab_frame")
-
-    # Check CameraSettings is a dataclass
-    assert hasattr(CameraSettings, "__dataclass_fields__")
-
-
-def test_daq_module_attributes():
-    """Test that imported DAQ modules have expected attributes."""
     from python.hardware.daq import DAQ
     from python.hardware.daq_mock import MockDAQ
     from python.hardware.daq_types import DAQSettings
 
-    # Check that DAQ class has expected methods
-    assert hasattr(DAQ, "__init__")
-    assert hasattr(DAQ, "initialize")
-    assert hasattr(DAQ, "cleanup")
-    assert hasattr(DAQ, "rotate")
-    assert hasattr(DAQ, "step")
-    assert hasattr(DAQ, "home")
-    assert hasattr(DAQ, "get_position")
-
-    # Check MockDAQ
-    assert hasattr(MockDAQ, "__init__")
-    assert hasattr(MockDAQ, "initialize")
-    assert hasattr(MockDAQ, "cleanup")
-    assert hasattr(MockDAQ, "rotate")
-    assert hasattr(MockDAQ, "step")
-    assert hasattr(MockDAQ, "home")
-    assert hasattr(MockDAQ, "get_position")
-
-    # Check DAQSettings is a dataclass
-    assert hasattr(DAQSettings, "__dataclass_fields__")
+    return SimpleNamespace(
+        Camera=Camera,
+        MockCamera=MockCamera,
+        CameraSettings=CameraSettings,
+        DAQ=DAQ,
+        MockDAQ=MockDAQ,
+        DAQSettings=DAQSettings,
+    )
+
+
+_CAMERA_METHODS = ("__init__", "open", "close", "grab_frame")
+_DAQ_METHODS = (
+    "__init__",
+    "initialize",
+    "cleanup",
+    "rotate",
+    "step",
+    "home",
+    "get_position",
+)
+
+
+@pytest.mark.parametrize(
+    "cls_name, attr",
+    [
+        *((cls, attr) for cls in ("Camera", "MockCamera") for attr in _CAMERA_METHODS),
+        *((cls, attr) for cls in ("DAQ", "MockDAQ") for attr in _DAQ_METHODS),
+        # Settings types are dataclasses
+        ("CameraSettings", "__dataclass_fields__"),
+        ("DAQSettings", "__dataclass_fields__"),
+    ],
+)
+def test_hardware_module_attributes(hw_modules, cls_name, attr):
+    """Test that imported camera and DAQ classes have expected attributes."""
+    assert hasattr(getattr(hw_modules, cls_name), attr)
 
 
 def test_graviscan_imports_bundled_path():
@@ -145,13 +146,13 @@ def test_import_error_handling():
     # This test verifies that if both import paths fail, the flags are set correctly
     # We can't easily mock this without reloading modules, but we can verify the
     # error message format is correct
-
-    import importlib
+    #
+    # No importlib.reload() here: the import fallback runs once, at first
+    # import, and these flags don't change afterwards. Reloading would
+    # re-run the whole hardware import chain and replace module-level state
+    # (streaming events, camera classes) other tests hold references to.
     import python.ipc_handler
 
-    # Reload to test import behavior (in case it was already imported)
-    importlib.reload(python.ipc_handler)
-
-    # After reload, in dev environment both should still be available
+    # In dev environment both should be available
     assert python.ipc_handler.CAMERA_AVAILABLE is True
     assert python.ipc_handler.DAQ_AVAILABLE is True
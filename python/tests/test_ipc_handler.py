@@ -1,6 +1,11 @@
 """Tests for IPC handler module."""
 
+import io
 import json
+import os
+import sys
+import threading
+import time
 
 import pytest
 
@@ -9,6 +14,7 @@ from python.ipc_handler import (
     send_status,
     send_error,
     send_data,
+    send_frame,
     check_hardware,
     handle_command,
 )
@@ -94,6 +100,38 @@ def test_send_data_includes_id_when_current_request_id_set(capsys):
     assert parsed == {"key": "value", "id": 7}
 
 
+def test_send_frame(capsys):
+    """Test that send_frame outputs one newline-terminated FRAME: line."""
+    send_frame("data:image/jpeg;base64,AAAA")
+    captured = capsys.readouterr()
+    assert captured.out == "FRAME:data:image/jpeg;base64,AAAA\n"
+
+
+def test_send_functions_write_each_line_in_one_call(monkeypatch):
+    """Every send_* writes its line and newline together, so a FRAME: line
+    from the streaming thread cannot land inside another response."""
+    writes = []
+
+    class RecordingStdout(io.StringIO):
+        def write(self, s):
+            writes.append(s)
+            return super().write(s)
+
+    monkeypatch.setattr(sys, "stdout", RecordingStdout())
+
+    send_status("ready")
+    send_error("boom")
+    send_data({"ok": True})
+    send_frame("data:image/jpeg;base64,AAAA")
+
+    assert writes == [
+        "STATUS:ready\n",
+        'ERROR:{"message": "boom"}\n',
+        'DATA:{"ok": true}\n',
+        "FRAME:data:image/jpeg;base64,AAAA\n",
+    ]
+
+
 def test_check_hardware():
     """Test that check_hardware returns detailed status dict."""
     status = check_hardware()
@@ -121,6 +159,115 @@ def test_check_hardware():
     assert isinstance(status["daq"]["available"], bool)
 
 
+def test_check_hardware_without_enumeration_skips_device_scan(monkeypatch):
+    """enumerate_devices=False reports library presence from find_spec()
+    only, without importing the driver modules."""
+    monkeypatch.setattr(ipc_handler.importlib.util, "find_spec", lambda name: object())
+    monkeypatch.setitem(sys.modules, "pypylon.pylon", None)
+    monkeypatch.setitem(sys.modules, "nidaqmx.system", None)
+
+    status = check_hardware(enumerate_devices=False)
+
+    for device in ("camera", "daq"):
+        assert status[device]["library_available"] is True
+        assert status[device]["devices_found"] == 0
+        assert status[device]["available"] is False
+
+
+def test_check_hardware_reports_missing_libraries(monkeypatch):
+    """A library that find_spec() cannot locate is reported unavailable."""
+    monkeypatch.setattr(ipc_handler.importlib.util, "find_spec", lambda name: None)
+
+    status = check_hardware()
+
+    assert status["camera"]["library_available"] is False
+    assert status["daq"]["library_available"] is False
+    assert status["camera"]["available"] is False
+    assert status["daq"]["available"] is False
+
+
+@pytest.fixture
+def hung_probe(monkeypatch):
+    """A device probe that blocks until the test ends.
+
+    Also gives the test an empty probe registry and makes find_spec() report
+    both libraries installed, so check_hardware() starts its device probes.
+    Threads that ran the probe are recorded in hung_probe.threads.
+    """
+    release = threading.Event()
+
+    def probe():
+        probe.threads.append(threading.current_thread())
+        release.wait(timeout=5.0)
+        return {"library_available": True, "devices_found": 1, "available": True}
+
+    probe.threads = []
+    monkeypatch.setattr(ipc_handler, "_hardware_probes", {})
+    monkeypatch.setattr(ipc_handler.importlib.util, "find_spec", lambda name: object())
+    yield probe
+    release.set()
+
+
+def test_check_hardware_hung_probe_times_out(monkeypatch, hung_probe):
+    """A probe that hangs past the timeout reports timed_out, not a missing
+    library."""
+    monkeypatch.setattr(ipc_handler, "HARDWARE_PROBE_TIMEOUT_S", 0.1)
+    monkeypatch.setattr(ipc_handler, "_probe_daq", hung_probe)
+    monkeypatch.setattr(
+        ipc_handler,
+        "_probe_camera",
+        lambda: {"library_available": True, "devices_found": 0, "available": False},
+    )
+
+    start = time.monotonic()
+    status = check_hardware()
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 1.0
+    assert status["daq"] == {
+        "library_available": True,
+        "devices_found": 0,
+        "available": False,
+        "timed_out": True,
+    }
+    assert "timed_out" not in status["camera"]
+
+
+def test_check_hardware_hung_probes_share_one_deadline(monkeypatch, hung_probe):
+    """Both probes hanging costs one timeout, not one per probe, and leaves
+    stderr restored and only daemon probe threads behind."""
+    monkeypatch.setattr(ipc_handler, "HARDWARE_PROBE_TIMEOUT_S", 0.4)
+    monkeypatch.setattr(ipc_handler, "_probe_camera", hung_probe)
+    monkeypatch.setattr(ipc_handler, "_probe_daq", hung_probe)
+    stderr_before = os.fstat(2)
+
+    start = time.monotonic()
+    status = check_hardware()
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.7
+    assert status["camera"]["timed_out"] is True
+    assert status["daq"]["timed_out"] is True
+    assert os.path.samestat(stderr_before, os.fstat(2))
+    assert len(hung_probe.threads) == 2
+    assert all(thread.daemon for thread in hung_probe.threads)
+
+
+def test_check_hardware_reuses_running_probe(monkeypatch, hung_probe):
+    """A repeated check waits on the probe still running from the last one
+    instead of starting another thread."""
+    monkeypatch.setattr(ipc_handler, "HARDWARE_PROBE_TIMEOUT_S", 0.1)
+    monkeypatch.setattr(ipc_handler, "_probe_camera", hung_probe)
+    monkeypatch.setattr(ipc_handler, "_probe_daq", hung_probe)
+
+    check_hardware()
+    status = check_hardware()
+
+    assert status["camera"]["timed_out"] is True
+    assert status["daq"]["timed_out"] is True
+    assert len(hung_probe.threads) == 2
+
+
 def test_handle_command_ping(capsys):
     """Test ping command."""
     handle_command({"command": "ping"})
@@ -195,3 +342,32 @@ def test_handle_command_with_no_id_omits_id_from_response(capsys):
 
     payload = json.loads(captured.out[len("DATA:") :].strip())
     assert "id" not in payload
+
+
+def test_handle_command_non_string_command(capsys):
+    """A non-string (e.g. unhashable) command name is reported as unknown."""
+    handle_command({"command": ["ping"]})
+    captured = capsys.readouterr()
+
+    assert captured.out.startswith("ERROR:")
+    payload = json.loads(captured.out[len("ERROR:") :].strip())
+    assert "Unknown command" in payload["message"]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, ipc_handler.DEFAULT_STREAM_FPS),
+        ("30", 30.0),
+        ("0", ipc_handler.DEFAULT_STREAM_FPS),
+        ("fast", ipc_handler.DEFAULT_STREAM_FPS),
+    ],
+)
+def test_stream_fps_env_override(monkeypatch, value, expected):
+    """BLOOM_STREAM_FPS overrides the stream rate; bad values use the default."""
+    if value is None:
+        monkeypatch.delenv("BLOOM_STREAM_FPS", raising=False)
+    else:
+        monkeypatch.setenv("BLOOM_STREAM_FPS", value)
+
+    assert ipc_handler._stream_fps() == expected
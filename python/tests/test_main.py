@@ -1,5 +1,8 @@
 """Tests for main.py entry point and command loop."""
 
+import builtins
+import contextlib
+import io
 import sys
 from unittest.mock import MagicMock, patch
 
@@ -8,100 +11,82 @@ import pytest
 from python.main import main
 
 
-def test_main_prints_header(capsys):
-    """Test that main() prints the startup header."""
-    # Simulate immediate exit
-    with patch("sys.argv", ["bloom-hardware"]):
-        with patch("builtins.input", side_effect=EOFError):
-            main()
-
-    captured = capsys.readouterr()
-    assert "Bloom Hardware Interface" in captured.out
-    assert "Python Version:" in captured.out
-    assert "Platform:" in captured.out
-
-
-def test_main_handles_exit_command(capsys):
-    """Test that 'exit' command shuts down cleanly."""
-    with patch("sys.argv", ["bloom-hardware"]):
-        with patch("builtins.input", return_value="exit"):
-            main()
-
-    captured = capsys.readouterr()
-    assert "Shutting down..." in captured.out
-
-
-def test_main_handles_quit_command(capsys):
-    """Test that 'quit' command shuts down cleanly."""
-    with patch("sys.argv", ["bloom-hardware"]):
-        with patch("builtins.input", return_value="quit"):
-            main()
+@pytest.fixture
+def input_stub(monkeypatch):
+    """Script the lines main() reads from builtins.input().
 
-    captured = capsys.readouterr()
-    assert "Shutting down..." in captured.out
-
-
-def test_main_handles_help_command(capsys):
-    """Test that 'help' command shows available commands."""
-    with patch("sys.argv", ["bloom-hardware"]):
-        with patch("builtins.input", side_effect=["help", "exit"]):
-            main()
+    Returns a function taking the sequence of responses; an exception class
+    in the sequence is raised instead of returned.
+    """
 
-    captured = capsys.readouterr()
-    assert "Available commands:" in captured.out
+    def install(script):
+        responses = iter(script)
 
+        def fake_input(prompt=""):
+            response = next(responses)
+            if isinstance(response, type) and issubclass(response, BaseException):
+                raise response
+            return response
 
-def test_main_handles_version_command(capsys):
-    """Test that 'version' command shows Python version."""
-    with patch("sys.argv", ["bloom-hardware"]):
-        with patch("builtins.input", side_effect=["version", "exit"]):
-            main()
+        monkeypatch.setattr(builtins, "input", fake_input)
 
-    captured = capsys.readouterr()
-    assert "Python" in captured.out
+    return install
 
 
-def test_main_handles_unknown_command(capsys):
-    """Test that unknown commands show error message."""
-    with patch("sys.argv", ["bloom-hardware"]):
-        with patch("builtins.input", side_effect=["foobar", "exit"]):
-            main()
+@pytest.fixture(scope="module")
+def startup_output():
+    """Run interactive main() once to EOF and return everything it printed.
 
-    captured = capsys.readouterr()
-    assert "Unknown command: foobar" in captured.out
+    Shared by the startup-banner tests, which only read the output.
+    """
 
+    def eof(prompt=""):
+        raise EOFError
 
-def test_main_handles_keyboard_interrupt(capsys):
-    """Test that Ctrl+C shuts down gracefully."""
-    with patch("sys.argv", ["bloom-hardware"]):
-        with patch("builtins.input", side_effect=KeyboardInterrupt):
+    buffer = io.StringIO()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(sys, "argv", ["bloom-hardware"])
+        mp.setattr(builtins, "input", eof)
+        with contextlib.redirect_stdout(buffer):
             main()
-
-    captured = capsys.readouterr()
-    assert "Shutting down..." in captured.out
+    return buffer.getvalue()
 
 
-def test_main_handles_eof(capsys):
-    """Test that EOF (Ctrl+D) shuts down gracefully."""
+def test_main_prints_header(startup_output):
+    """Test that main() prints the startup header."""
+    assert "Bloom Hardware Interface" in startup_output
+    assert "Python Version:" in startup_output
+    assert "Platform:" in startup_output
+
+
+@pytest.mark.parametrize(
+    "script, expected",
+    [
+        pytest.param(["exit"], "Shutting down...", id="exit"),
+        pytest.param(["quit"], "Shutting down...", id="quit"),
+        pytest.param(["help", "exit"], "Available commands:", id="help"),
+        pytest.param(["version", "exit"], "Python", id="version"),
+        pytest.param(["foobar", "exit"], "Unknown command: foobar", id="unknown"),
+        pytest.param([KeyboardInterrupt], "Shutting down...", id="ctrl-c"),
+        pytest.param([EOFError], "Shutting down...", id="eof"),
+    ],
+)
+def test_main_handles_command(capsys, input_stub, script, expected):
+    """Test each interactive command (and Ctrl+C / Ctrl+D) gives its output."""
     with patch("sys.argv", ["bloom-hardware"]):
-        with patch("builtins.input", side_effect=EOFError):
-            main()
+        input_stub(script)
+        main()
 
     captured = capsys.readouterr()
-    assert "Shutting down..." in captured.out
+    assert expected in captured.out
 
 
-def test_main_prints_import_status(capsys):
+def test_main_prints_import_status(startup_output):
     """Test that import status is printed for dependencies."""
-    with patch("sys.argv", ["bloom-hardware"]):
-        with patch("builtins.input", side_effect=EOFError):
-            main()
-
-    captured = capsys.readouterr()
     # Should show status for all three dependencies
-    assert "NumPy" in captured.out
-    assert "PyPylon" in captured.out
-    assert "NI-DAQmx" in captured.out
+    assert "NumPy" in startup_output
+    assert "PyPylon" in startup_output
+    assert "NI-DAQmx" in startup_output
 
 
 def test_main_scan_worker_mode_routing():
@@ -5,11 +5,14 @@ Tests the Scanner class which coordinates Camera and DAQ for automated
 cylinder scanning workflows. Uses mock hardware with real test fixtures.
 """
 
+import copy
 import glob
 import os
+from unittest.mock import patch
 
 import pytest
 
+from python.hardware.camera_mock import MockCamera
 from python.hardware.scanner import MockScanner, Scanner
 from python.hardware.scanner_types import ScanResult, ScannerSettings
 
@@ -17,9 +20,13 @@ from python.hardware.scanner_types import ScanResult, ScannerSettings
 os.environ["BLOOM_USE_MOCK_HARDWARE"] = "true"
 
 
-@pytest.fixture
-def scanner_settings():
-    """Create scanner settings for testing."""
+@pytest.fixture(scope="session")
+def scanner_settings_dict():
+    """Create scanner settings for testing, as the raw dict.
+
+    Session-scoped and shared between tests: tests that mutate the dict
+    must work on a ``copy.deepcopy()`` of it.
+    """
     return {
         "camera": {
             "exposure_time": 10000,
@@ -43,9 +50,12 @@ def scanner_settings():
     }
 
 
-@pytest.fixture
-def small_scan_settings():
-    """Create settings for a small scan (fewer frames for speed)."""
+@pytest.fixture(scope="session")
+def small_scan_settings_dict():
+    """Create settings for a small scan (fewer frames for speed), as a dict.
+
+    Session-scoped and shared between tests, like ``scanner_settings_dict``.
+    """
     return {
         "camera": {
             "exposure_time": 10000,
@@ -69,59 +79,143 @@ def small_scan_settings():
     }
 
 
+@pytest.fixture(scope="session")
+def scanner_settings(scanner_settings_dict):
+    """Validated ScannerSettings for a full 72-frame scan (read-only)."""
+    return ScannerSettings(**scanner_settings_dict)
+
+
+@pytest.fixture(scope="session")
+def small_scan_settings(small_scan_settings_dict):
+    """Validated ScannerSettings for a 5-frame scan (read-only)."""
+    return ScannerSettings(**small_scan_settings_dict)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def shared_test_images():
+    """Decode the sample scan images once for every MockCamera in this module.
+
+    MockCamera.__init__ otherwise decodes all 72 sample PNGs (~160 MB) per
+    instance. Sharing one list is safe: MockCamera only reads it, and
+    grab_frame() hands out copies.
+    """
+    images = []
+    load_test_images = MockCamera._load_test_images
+
+    def load_once(camera):
+        if not images:
+            images.extend(load_test_images(camera))
+        return images
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(MockCamera, "_load_test_images", load_once)
+        yield images
+
+
+@pytest.fixture(scope="class")
+def initialized_scanner(small_scan_settings):
+    """Initialize one small-scan Scanner per test class and clean it up after.
+
+    Only for tests that leave the scanner initialized and homed; tests that
+    exercise initialize()/cleanup() themselves build their own Scanner.
+    """
+    scanner = Scanner(small_scan_settings)
+    scanner.initialize()
+    yield scanner
+    scanner.cleanup()
+
+
+@pytest.fixture
+def fresh_scanner(scanner_settings):
+    """Create a Scanner that has not been initialized."""
+    return Scanner(scanner_settings)
+
+
+@pytest.fixture
+def frame_count_settings(request):
+    """Create ScannerSettings for a scan of ``request.param`` frames."""
+    num_frames = request.param
+    return ScannerSettings(
+        camera={
+            "exposure_time": 10000,
+            "gain": 100,
+            "camera_ip_address": None,
+            "gamma": 1.0,
+            "num_frames": num_frames,
+            "seconds_per_rot": 36.0,
+        },
+        daq={
+            "device_name": "cDAQ1Mod1",
+            "sampling_rate": 40000,
+            "step_pin": 0,
+            "dir_pin": 1,
+            "steps_per_revolution": 6400,
+            "num_frames": num_frames,
+            "seconds_per_rot": 36.0,
+        },
+        num_frames=num_frames,
+        output_path="./test-scans",
+    )
+
+
 class TestScannerSettings:
     """Test ScannerSettings dataclass validation and conversion."""
 
-    def test_scanner_settings_creates_from_dicts(self, scanner_settings):
+    def test_scanner_settings_creates_from_dicts(self, scanner_settings_dict):
         """Test that ScannerSettings converts dicts to proper types."""
         from python.hardware.camera_types import CameraSettings
         from python.hardware.daq_types import DAQSettings
 
-        settings = ScannerSettings(**scanner_settings)
+        settings = ScannerSettings(**scanner_settings_dict)
 
         assert isinstance(settings.camera, CameraSettings)
         assert isinstance(settings.daq, DAQSettings)
         assert settings.num_frames == 72
         assert settings.output_path == "./test-scans"
 
-    def test_scanner_settings_validates_positive_num_frames(self, scanner_settings):
+    def test_scanner_settings_validates_positive_num_frames(
+        self, scanner_settings_dict
+    ):
         """Test that num_frames must be positive."""
-        scanner_settings["num_frames"] = 0
+        scanner_settings_dict = copy.deepcopy(scanner_settings_dict)
+        scanner_settings_dict["num_frames"] = 0
 
         with pytest.raises(ValueError, match="num_frames must be positive"):
-            ScannerSettings(**scanner_settings)
+            ScannerSettings(**scanner_settings_dict)
 
-        scanner_settings["num_frames"] = -10
+        scanner_settings_dict["num_frames"] = -10
         with pytest.raises(ValueError, match="num_frames must be positive"):
-            ScannerSettings(**scanner_settings)
+            ScannerSettings(**scanner_settings_dict)
 
-    def test_scanner_settings_validates_output_path(self, scanner_settings):
+    def test_scanner_settings_validates_output_path(self, scanner_settings_dict):
         """Test that output_path cannot be empty."""
-        scanner_settings["output_path"] = ""
+        scanner_settings_dict = copy.deepcopy(scanner_settings_dict)
+        scanner_settings_dict["output_path"] = ""
 
         with pytest.raises(ValueError, match="output_path cannot be empty"):
-            ScannerSettings(**scanner_settings)
+            ScannerSettings(**scanner_settings_dict)
 
-    def test_scanner_settings_syncs_num_frames(self, scanner_settings):
+    def test_scanner_settings_syncs_num_frames(self, scanner_settings_dict):
         """Test that scanner num_frames overrides camera and daq."""
-        scanner_settings["num_frames"] = 36
-        scanner_settings["camera"]["num_frames"] = 72
-        scanner_settings["daq"]["num_frames"] = 144
+        scanner_settings_dict = copy.deepcopy(scanner_settings_dict)
+        scanner_settings_dict["num_frames"] = 36
+        scanner_settings_dict["camera"]["num_frames"] = 72
+        scanner_settings_dict["daq"]["num_frames"] = 144
 
-        settings = ScannerSettings(**scanner_settings)
+        settings = ScannerSettings(**scanner_settings_dict)
 
         # All should be synced to scanner's num_frames
         assert settings.num_frames == 36
         assert settings.camera.num_frames == 36
         assert settings.daq.num_frames == 36
 
-    def test_scanner_settings_accepts_camera_dataclass(self, scanner_settings):
+    def test_scanner_settings_accepts_camera_dataclass(self, scanner_settings_dict):
         """Test that ScannerSettings accepts CameraSettings objects and syncs num_frames."""
         from python.hardware.camera_types import CameraSettings
         from python.hardware.daq_types import DAQSettings
 
-        camera_settings = CameraSettings(**scanner_settings["camera"])
-        daq_settings = DAQSettings(**scanner_settings["daq"])
+        camera_settings = CameraSettings(**scanner_settings_dict["camera"])
+        daq_settings = DAQSettings(**scanner_settings_dict["daq"])
 
         settings = ScannerSettings(
             camera=camera_settings,
@@ -141,10 +235,9 @@ class TestScannerSettings:
 class TestScannerInitialization:
     """Test Scanner initialization with mock hardware."""
 
-    def test_scanner_creates_uninitialized(self, scanner_settings):
+    def test_scanner_creates_uninitialized(self, fresh_scanner):
         """Test that Scanner starts uninitialized."""
-        settings = ScannerSettings(**scanner_settings)
-        scanner = Scanner(settings)
+        scanner = fresh_scanner
 
         assert scanner.is_initialized is False
         assert scanner.camera is None
@@ -153,8 +246,7 @@ class TestScannerInitialization:
 
     def test_scanner_initialize_success(self, small_scan_settings):
         """Test successful scanner initialization."""
-        settings = ScannerSettings(**small_scan_settings)
-        scanner = Scanner(settings)
+        scanner = Scanner(small_scan_settings)
 
         scanner.initialize()
 
@@ -167,24 +259,27 @@ class TestScannerInitialization:
         # Cleanup
         scanner.cleanup()
 
-    def test_scanner_initialize_idempotent(self, small_scan_settings):
+    def test_scanner_initialize_idempotent(self, initialized_scanner):
         """Test that initialize can be called multiple times safely."""
-        settings = ScannerSettings(**small_scan_settings)
-        scanner = Scanner(settings)
-
-        scanner.initialize()
-        assert scanner.is_initialized is True
+        scanner = initialized_scanner
+        camera, daq = scanner.camera, scanner.daq
+
+        # Second call should be safe, return early, and keep the same hardware
+        with (
+            patch("python.hardware.scanner.MockCamera") as mock_camera_cls,
+            patch("python.hardware.scanner.MockDAQ") as mock_daq_cls,
+        ):
+            scanner.initialize()
 
-        # Second call should be safe
-        scanner.initialize()
+        mock_camera_cls.assert_not_called()
+        mock_daq_cls.assert_not_called()
         assert scanner.is_initialized is True
-
-        scanner.cleanup()
+        assert scanner.camera is camera
+        assert scanner.daq is daq
 
     def test_scanner_cleanup_releases_resources(self, small_scan_settings):
         """Test that cleanup releases camera and DAQ."""
-        settings = ScannerSettings(**small_scan_settings)
-        scanner = Scanner(settings)
+        scanner = Scanner(small_scan_settings)
 
         scanner.initialize()
         assert scanner.camera is not None
@@ -196,10 +291,9 @@ class TestScannerInitialization:
         assert scanner.daq is None
         assert scanner.is_initialized is False
 
-    def test_scanner_cleanup_without_init(self, scanner_settings):
+    def test_scanner_cleanup_without_init(self, fresh_scanner):
         """Test that cleanup works even if never initialized."""
-        settings = ScannerSettings(**scanner_settings)
-        scanner = Scanner(settings)
+        scanner = fresh_scanner
 
         # Should not raise
         scanner.cleanup()
@@ -211,12 +305,9 @@ class TestScannerInitialization:
 class TestScannerStatus:
     """Test Scanner status reporting."""
 
-    def test_get_status_before_init(self, scanner_settings):
+    def test_get_status_before_init(self, fresh_scanner):
         """Test status before initialization."""
-        settings = ScannerSettings(**scanner_settings)
-        scanner = Scanner(settings)
-
-        status = scanner.get_status()
+        status = fresh_scanner.get_status()
 
         assert status["initialized"] is False
         assert status["camera_status"] == "unknown"
@@ -224,13 +315,9 @@ class TestScannerStatus:
         assert status["position"] == 0.0
         assert status["mock"] is True
 
-    def test_get_status_after_init(self, small_scan_settings):
+    def test_get_status_after_init(self, initialized_scanner):
         """Test status after initialization."""
-        settings = ScannerSettings(**small_scan_settings)
-        scanner = Scanner(settings)
-        scanner.initialize()
-
-        status = scanner.get_status()
+        status = initialized_scanner.get_status()
 
         assert status["initialized"] is True
         assert status["camera_status"] == "connected"
@@ -238,12 +325,9 @@ class TestScannerStatus:
         assert status["position"] == 0.0
         assert status["mock"] is True
 
-        scanner.cleanup()
-
     def test_get_status_after_cleanup(self, small_scan_settings):
         """Test status after cleanup."""
-        settings = ScannerSettings(**small_scan_settings)
-        scanner = Scanner(settings)
+        scanner = Scanner(small_scan_settings)
         scanner.initialize()
         scanner.cleanup()
 
@@ -257,21 +341,14 @@ class TestScannerStatus:
 class TestScannerScan:
     """Test Scanner scanning workflow."""
 
-    def test_perform_scan_requires_initialization(self, small_scan_settings):
+    def test_perform_scan_requires_initialization(self, fresh_scanner):
         """Test that scan fails if not initialized."""
-        settings = ScannerSettings(**small_scan_settings)
-        scanner = Scanner(settings)
-
         with pytest.raises(RuntimeError, match="not initialized"):
-            scanner.perform_scan()
+            fresh_scanner.perform_scan()
 
-    def test_perform_scan_success(self, small_scan_settings):
+    def test_perform_scan_success(self, initialized_scanner):
         """Test successful scan with 5 frames."""
-        settings = ScannerSettings(**small_scan_settings)
-        scanner = Scanner(settings)
-        scanner.initialize()
-
-        result = scanner.perform_scan()
+        result = initialized_scanner.perform_scan()
 
         assert result.success is True
         assert result.frames_captured == 5
@@ -279,14 +356,9 @@ class TestScannerScan:
         assert result.output_path == "test-scans"
         assert result.error is None
 
-        scanner.cleanup()
-
-    def test_perform_scan_returns_to_home(self, small_scan_settings):
+    def test_perform_scan_returns_to_home(self, initialized_scanner):
         """Test that scan returns turntable to home position."""
-        settings = ScannerSettings(**small_scan_settings)
-        scanner = Scanner(settings)
-        scanner.initialize()
-
+        scanner = initialized_scanner
         initial_position = scanner.daq.get_position()
 
         scanner.perform_scan()
@@ -297,14 +369,8 @@ class TestScannerScan:
         assert abs(final_position - initial_position) < 1.0
         assert abs(final_position) < 1.0
 
-        scanner.cleanup()
-
-    def test_perform_scan_with_callback(self, small_scan_settings):
+    def test_perform_scan_with_callback(self, initialized_scanner):
         """Test scan with progress callback."""
-        settings = ScannerSettings(**small_scan_settings)
-        scanner = Scanner(settings)
-        scanner.initialize()
-
         frames_reported = []
         positions_reported = []
 
@@ -312,7 +378,7 @@ class TestScannerScan:
             frames_reported.append(frame_idx)
             positions_reported.append(position)
 
-        result = scanner.perform_scan(on_frame=on_frame)
+        result = initialized_scanner.perform_scan(on_frame=on_frame)
 
         assert result.success is True
         assert len(frames_reported) == 5
@@ -321,42 +387,18 @@ class TestScannerScan:
         # Positions should increase (roughly 72° per frame for 5 frames)
         assert positions_reported[0] < positions_reported[1]
 
-        scanner.cleanup()
-
-    def test_perform_scan_different_frame_counts(self):
+    @pytest.mark.parametrize("frame_count_settings", [3, 6, 12], indirect=True)
+    def test_perform_scan_different_frame_counts(self, frame_count_settings):
         """Test scanning with different frame counts."""
-        for num_frames in [3, 6, 12]:
-            settings = ScannerSettings(
-                camera={
-                    "exposure_time": 10000,
-                    "gain": 100,
-                    "camera_ip_address": None,
-                    "gamma": 1.0,
-                    "num_frames": num_frames,
-                    "seconds_per_rot": 36.0,
-                },
-                daq={
-                    "device_name": "cDAQ1Mod1",
-                    "sampling_rate": 40000,
-                    "step_pin": 0,
-                    "dir_pin": 1,
-                    "steps_per_revolution": 6400,
-                    "num_frames": num_frames,
-                    "seconds_per_rot": 36.0,
-                },
-                num_frames=num_frames,
-                output_path="./test-scans",
-            )
-
-            scanner = Scanner(settings)
-            scanner.initialize()
+        scanner = Scanner(frame_count_settings)
+        scanner.initialize()
 
-            result = scanner.perform_scan()
+        result = scanner.perform_scan()
 
-            assert result.success is True
-            assert result.frames_captured == num_frames
+        assert result.success is True
+        assert result.frames_captured == frame_count_settings.num_frames
 
-            scanner.cleanup()
+        scanner.cleanup()
 
 
 class TestMockScanner:
@@ -364,15 +406,13 @@ class TestMockScanner:
 
     def test_mock_scanner_always_uses_mock(self, scanner_settings):
         """Test that MockScanner forces mock hardware."""
-        settings = ScannerSettings(**scanner_settings)
-        scanner = MockScanner(settings)
+        scanner = MockScanner(scanner_settings)
 
         assert scanner._use_mock is True
 
     def test_mock_scanner_works_like_scanner(self, small_scan_settings):
         """Test that MockScanner behaves like Scanner."""
-        settings = ScannerSettings(**small_scan_settings)
-        scanner = MockScanner(settings)
+        scanner = MockScanner(small_scan_settings)
 
         scanner.initialize()
         result = scanner.perform_scan()
@@ -414,8 +454,7 @@ class TestScannerThreadSafety:
     def test_perform_scan_from_main_thread_is_allowed(self, small_scan_settings):
         """The belt-and-suspenders main-thread check (#40) does not
         reject normal single-threaded usage."""
-        settings = ScannerSettings(**small_scan_settings)
-        scanner = Scanner(settings)
+        scanner = Scanner(small_scan_settings)
         scanner.initialize()
 
         result = scanner.perform_scan()  # must not raise
@@ -429,8 +468,7 @@ class TestScannerThreadSafety:
         the single-threaded invariant this decision relies on."""
         import threading
 
-        settings = ScannerSettings(**small_scan_settings)
-        scanner = Scanner(settings)
+        scanner = Scanner(small_scan_settings)
         scanner.initialize()
 
         errors = []
@@ -456,8 +494,7 @@ class TestScannerThreadSafety:
         raises RuntimeError immediately, same as perform_scan()."""
         import threading
 
-        settings = ScannerSettings(**small_scan_settings)
-        scanner = Scanner(settings)
+        scanner = Scanner(small_scan_settings)
         scanner.initialize()
 
         errors = []
@@ -484,8 +521,7 @@ class TestScannerThreadSafety:
         immediately'. Confirmed via scanner.py:105-106 this already
         exists in code — this test just adds the coverage that was
         missing."""
-        settings = ScannerSettings(**small_scan_settings)
-        scanner = Scanner(settings)
+        scanner = Scanner(small_scan_settings)
         scanner.initialize()
 
         scanner.is_scanning = True
@@ -502,8 +538,7 @@ class TestScannerEdgeCases:
 
     def test_scanner_cleanup_handles_exceptions(self, small_scan_settings):
         """Test that cleanup handles exceptions gracefully."""
-        settings = ScannerSettings(**small_scan_settings)
-        scanner = Scanner(settings)
+        scanner = Scanner(small_scan_settings)
         scanner.initialize()
 
         # Manually break camera to cause exception
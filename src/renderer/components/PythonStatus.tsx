@@ -12,11 +12,13 @@ interface HardwareStatus {
     library_available: boolean;
     devices_found: number;
     available: boolean;
+    timed_out?: boolean;
   };
   daq: {
     library_available: boolean;
     devices_found: number;
     available: boolean;
+    timed_out?: boolean;
   };
 }
 
@@ -156,6 +158,10 @@ export function PythonStatus({ mode = null }: PythonStatusProps) {
                   <span className="text-green-600 font-semibold">
                     [OK] {hardware.camera.devices_found} device(s) found
                   </span>
+                ) : hardware.camera.timed_out ? (
+                  <span className="text-yellow-600">
+                    [WARN] Device scan timed out
+                  </span>
                 ) : hardware.camera.library_available ? (
                   <span className="text-yellow-600">
                     [WARN] Library installed, no devices found
@@ -173,6 +179,10 @@ export function PythonStatus({ mode = null }: PythonStatusProps) {
                   <span className="text-green-600 font-semibold">
                     [OK] {hardware.daq.devices_found} device(s) found
                   </span>
+                ) : hardware.daq.timed_out ? (
+                  <span className="text-yellow-600">
+                    [WARN] Device scan timed out
+                  </span>
                 ) : hardware.daq.library_available ? (
                   <span className="text-yellow-600">
                     [WARN] Library installed, no devices found
@@ -107,11 +107,13 @@ export interface PythonAPI {
       library_available: boolean;
       devices_found: number;
       available: boolean;
+      timed_out?: boolean;
     };
     daq: {
       library_available: boolean;
       devices_found: number;
       available: boolean;
+      timed_out?: boolean;
     };
   }>;
 